@@ -43,6 +43,9 @@ if spec and spec.loader:
 else:
     raise ImportError(f"Cannot load vision_bridge from {VISION_BRIDGE_PATH}")
 
+# pic_compare core is first on sys.path (see above), so this is pic_compare/core/rt_util.py
+from core.rt_util import pin_and_raise  # noqa: E402
+
 # Ensure lidar_distance core has priority for LiDAR imports
 LIDAR_NEW_LIDAR_PATH = PYTHONCODE_ROOT / "core" / "new_lidar.py"
 LIDAR_ZONE_LOGIC_PATH = PYTHONCODE_ROOT / "core" / "lidar_zone_logic.py"
@@ -213,6 +216,8 @@ def main(page: ft.Page) -> None:
     vision_bridge = VisionBridge()
 
     def vision_loop() -> None:
+        # Keep the vision tick off the cores used by camera decode threads (needs CAP_SYS_NICE)
+        pin_and_raise(cpu=2, prio=80)
         while True:
             snap = vision_bridge.read_once()
             vision_state["snapshot"] = snap
@@ -11,12 +11,19 @@ and provides a simple API:
     frame = driver.get_frame()
     driver.close()
 
+For RTSP streams where stale buffered frames matter, call:
+
+    driver.configure_latency()
+    driver.start_grabber()   # background read(); get_frame()/read() return the newest frame
+
 When run as a script, it will open the camera and print several frame shapes
 for quick debugging.
 """
 
 from __future__ import annotations
 
+import os
+import threading
 import time
 from typing import Optional, Tuple
 
@@ -25,8 +32,43 @@ import cv2
 # Try to import config both when used as a package and as a standalone script.
 try:
     from core import config  # type: ignore
+    from core.rt_util import pin_and_raise  # type: ignore
 except ImportError:  # running as "python core/camera_driver.py"
     import config  # type: ignore
+    from rt_util import pin_and_raise  # type: ignore
+
+# FFmpeg low-latency options; must be in the environment before VideoCapture is created.
+FFMPEG_LOW_LATENCY_OPTIONS = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay"
+
+# USB capture format: compressed MJPEG instead of raw YUYV (less USB bandwidth,
+# higher frame rates at the same resolution), one buffered frame.
+USB_FOURCC = "MJPG"
+USB_FPS = 30
+
+
+def open_usb_camera(index: int = 0, fps: int = USB_FPS) -> cv2.VideoCapture:
+    """
+    cv2.VideoCapture(index) with MJPEG, a 1-frame buffer and the requested FPS.
+    Backends that don't support a property simply ignore it.
+    """
+    cap = cv2.VideoCapture(index)
+    if cap.isOpened():
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*USB_FOURCC))
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    return cap
+
+
+def open_rtsp_camera(url: str) -> cv2.VideoCapture:
+    """
+    cv2.VideoCapture(url) on the FFMPEG backend with the low-latency capture
+    options and a 1-frame buffer, so reads return the newest decoded frame.
+    """
+    os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", FFMPEG_LOW_LATENCY_OPTIONS)
+    cap = cv2.VideoCapture(url, cv2.CAP_FFMPEG)
+    if cap.isOpened():
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
 
 
 class CameraDriver:
@@ -37,6 +79,14 @@ class CameraDriver:
         self.cap: Optional[cv2.VideoCapture] = None
         self.source_desc: str = "UNINITIALIZED"
 
+        # background grabber state (see start_grabber)
+        self._frame_lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._latest: Optional["cv2.Mat"] = None
+        self._read_timeout = 1.0
+        self._grab_stop = threading.Event()
+        self._grab_thread: Optional[threading.Thread] = None
+
     # ------------------------------------------------------------------
     # low-level open/close
     # ------------------------------------------------------------------
@@ -53,8 +103,7 @@ class CameraDriver:
         # 1) RTSP 优先
         if self.cfg.use_rtsp:
             print(f"[CameraDriver] Trying RTSP: {self.cfg.rtsp_url}")
-            self.cap = cv2.VideoCapture(self.cfg.rtsp_url)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap = open_rtsp_camera(self.cfg.rtsp_url)
             if self.cap.isOpened():
                 self.source_desc = f"RTSP({self.cfg.rtsp_url})"
                 print(f"[CameraDriver] RTSP opened OK: {self.source_desc}")
@@ -67,7 +116,7 @@ class CameraDriver:
 
         # 2) USB 摄像头回退方案
         print(f"[CameraDriver] Trying USB device index={self.cfg.device_index}")
-        self.cap = cv2.VideoCapture(self.cfg.device_index)
+        self.cap = open_usb_camera(self.cfg.device_index)
         if self.cap.isOpened():
             self.source_desc = f"USB(index={self.cfg.device_index})"
             print(f"[CameraDriver] USB camera opened OK: {self.source_desc}")
@@ -78,13 +127,72 @@ class CameraDriver:
         self.source_desc = "FAILED"
         return False
 
+    def configure_latency(self) -> None:
+        """Ask the backend to keep only the newest frame (FFMPEG backend only)."""
+        if self.cap is None:
+            return
+        if self.cap.getBackendName() == "FFMPEG":
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
     def close(self) -> None:
         """Release camera resource."""
+        self.stop_grabber()
         if self.cap is not None:
             self.cap.release()
             self.cap = None
             print("[CameraDriver] Camera released.")
 
+    # ------------------------------------------------------------------
+    # background grabber
+    # ------------------------------------------------------------------
+    def start_grabber(self, timeout: float = 1.0) -> None:
+        """Start a thread that keeps calling cap.read() to drain stale frames.
+
+        Capture and decode run in the thread and only the newest frame is kept
+        (same scheme as core.rtsp_reader.RtspReader). While it runs,
+        get_frame()/read() wait up to `timeout` seconds for a frame that has
+        not been returned yet, so the same frame is never handed out twice.
+        grab()/retrieve() return False/None while the grabber is running.
+        """
+        if self.cap is None or self._grab_thread is not None:
+            return
+        self._read_timeout = timeout
+        self._grab_stop.clear()
+        self._new_frame.clear()
+        self._latest = None
+        self._grab_thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._grab_thread.start()
+
+    def stop_grabber(self) -> None:
+        """Stop the background grabber thread, if any."""
+        if self._grab_thread is None:
+            return
+        self._grab_stop.set()
+        self._grab_thread.join(timeout=1.0)
+        self._grab_thread = None
+
+    def _grab_loop(self) -> None:
+        pin_and_raise(cpu=3, prio=85)
+        cap = self.cap
+        while not self._grab_stop.is_set():
+            # blocking read outside any lock; only the slot update is locked
+            ok, frame = cap.read()
+            if not ok or frame is None:
+                self._grab_stop.wait(0.05)
+                continue
+            with self._frame_lock:
+                self._latest = frame
+                self._new_frame.set()
+
+    def _read_latest(self) -> Tuple[bool, Optional["cv2.Mat"]]:
+        if self._grab_thread is None:
+            return self.cap.read()
+        if not self._new_frame.wait(self._read_timeout):
+            return False, None
+        with self._frame_lock:
+            self._new_frame.clear()
+            return True, self._latest
+
     # ------------------------------------------------------------------
     # frame API
     # ------------------------------------------------------------------
@@ -97,7 +205,7 @@ class CameraDriver:
         if self.cap is None:
             return None
 
-        ok, frame = self.cap.read()
+        ok, frame = self._read_latest()
         if not ok:
             return None
         return frame
@@ -109,6 +217,26 @@ class CameraDriver:
             return None, None
         return frame, frame.shape
 
+    def grab(self) -> bool:
+        """Advance the stream by one frame without decoding it (cap.grab()).
+
+        Returns False while the background grabber owns the capture
+        (start_grabber); use get_frame()/read() then.
+        """
+        if self.cap is None or self._grab_thread is not None:
+            return False
+        return self.cap.grab()
+
+    def retrieve(self) -> Optional["cv2.Mat"]:
+        """Decode the most recently grabbed frame; None on failure.
+
+        Returns None while the background grabber is running (see grab()).
+        """
+        if self.cap is None or self._grab_thread is not None:
+            return None
+        ok, frame = self.cap.retrieve()
+        return frame if ok else None
+
     def read(self):
         """
         Read a frame from the underlying cv2.VideoCapture.
@@ -117,11 +245,12 @@ class CameraDriver:
         """
         if self.cap is None or not self.cap.isOpened():
             return False, None
-        ok, frame = self.cap.read()
+        ok, frame = self._read_latest()
         return ok, frame
 
     def release(self) -> None:
         """Release camera resource (alias for close)."""
+        self.stop_grabber()
         if self.cap is not None and self.cap.isOpened():
             self.cap.release()
         self.cap = None
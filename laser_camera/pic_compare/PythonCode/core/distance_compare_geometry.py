@@ -75,6 +75,19 @@ def signed_distance_to_line(
     Return distance in pixels.
     """
     x0, y0 = point
+    a, b, c = line_coefficients(p1, p2)
+    return a * x0 + b * y0 + c
+
+
+def line_coefficients(
+    p1: Tuple[float, float],
+    p2: Tuple[float, float],
+) -> Tuple[float, float, float]:
+    """
+    Normalized (a, b, c) of the line p1-p2 so that a*x + b*y + c is the
+    signed pixel distance used by signed_distance_to_line (same sign
+    convention). Compute once per line and reuse for every point / frame.
+    """
     x1, y1 = p1
     x2, y2 = p2
     dx = x2 - x1
@@ -85,10 +98,7 @@ def signed_distance_to_line(
     b = -dx
     c = dx * y1 - dy * x1
     norm = np.hypot(a, b)
-    a /= norm
-    b /= norm
-    c /= norm
-    return a * x0 + b * y0 + c
+    return float(a / norm), float(b / norm), float(c / norm)
 
 
 def classify_point_zone(
@@ -132,6 +142,14 @@ class YellowLineZone(Enum):
     INSIDE_DANGER = auto()  # 已经明显越线，危险区
 
 
+# classify_point_zone() text -> YellowLineZone
+_YELLOW_ZONE_BY_TEXT = {
+    "OUTSIDE_SAFE": YellowLineZone.OUTSIDE_SAFE,
+    "ON_LINE": YellowLineZone.ON_LINE,
+    "INSIDE_DANGER": YellowLineZone.INSIDE_DANGER,
+}
+
+
 @dataclass
 class FootPoint:
     """Bottom-center of a person bbox."""
@@ -140,7 +158,7 @@ class FootPoint:
     bbox: Tuple[int, int, int, int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeometryResult:
     """Result of the geometry evaluation."""
     distance_px: float                  # foot_y - y_line
@@ -198,12 +216,7 @@ def evaluate_feet_against_line(
     d = primary.y - y_line
 
     zone_str = classify_point_zone(d, config.DISTANCE_COMPARE)
-    if zone_str == "OUTSIDE_SAFE":
-        zone = YellowLineZone.OUTSIDE_SAFE
-    elif zone_str == "ON_LINE":
-        zone = YellowLineZone.ON_LINE
-    else:
-        zone = YellowLineZone.INSIDE_DANGER
+    zone = _YELLOW_ZONE_BY_TEXT.get(zone_str, YellowLineZone.INSIDE_DANGER)
 
     return GeometryResult(distance_px=float(d), zone=zone, foot=primary)
 
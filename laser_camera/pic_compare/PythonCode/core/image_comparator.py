@@ -13,6 +13,32 @@ from typing import List, Tuple
 import cv2
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional: fall back to cv2.absdiff + cv2.threshold
+    HAVE_NUMBA = False
+
+# |cur - prev| above this grey level counts as motion
+DIFF_PIXEL_THRESHOLD = 25
+
+# static-scene pre-check (skip_static): thumbnail width and the largest
+# per-pixel thumbnail change still treated as "same scene"
+STATIC_THUMB_W = 64
+STATIC_THUMB_MAX_DIFF = 4
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True)
+    def _diff_threshold_nb(prev, cur, thr, mask_out):
+        """mask_out = 255 where |cur - prev| > thr else 0, one fused pass over uint8 rows."""
+        for i in prange(prev.shape[0]):
+            for j in range(prev.shape[1]):
+                p = prev[i, j]
+                c = cur[i, j]
+                d = c - p if c > p else p - c
+                mask_out[i, j] = 255 if d > thr else 0
+
 
 class ImageComparator:
     def __init__(
@@ -20,24 +46,106 @@ class ImageComparator:
         mode: str = "frame_diff",
         diff_threshold: float = 0.02,
         min_area: int = 800,
+        proc_width: int | None = None,
+        skip_static: bool = False,
+        proc_interp: int = cv2.INTER_AREA,
     ) -> None:
+        """
+        proc_width: if set, frames wider than this are downscaled (with
+            proc_interp) to proc_width before differencing. min_area stays in
+            full-frame pixels and returned bboxes are mapped back to full-frame
+            coordinates; motion_mask is at the processing resolution.
+        proc_interp: cv2 interpolation for the proc_width downscale. INTER_AREA
+            averages (least aliasing); INTER_NEAREST is much cheaper and is
+            enough for an exact 2x/4x step, since the diff is blurred anyway.
+        skip_static: frame_diff only. If the last result had no motion and a
+            STATIC_THUMB_W-wide grey thumbnail is unchanged (max diff <=
+            STATIC_THUMB_MAX_DIFF) since the last compared frame, return that
+            result again instead of differencing the full frame.
+        """
         if mode not in {"frame_diff", "bg_sub"}:
             raise ValueError(f"Unsupported mode: {mode}")
 
         self.mode = mode
         self.diff_threshold = diff_threshold
         self.min_area = min_area
+        self.proc_width = proc_width
+        self.proc_interp = proc_interp
+        self.skip_static = skip_static and mode == "frame_diff"
 
+        self._small: np.ndarray | None = None  # reused resize buffer
+        self._area_scale = 1.0  # (proc / full)^2, applied to min_area
         self._prev_gray: np.ndarray | None = None
+        self._thresh: np.ndarray | None = None  # reused motion-mask buffer (numba path)
+        self._thumb: np.ndarray | None = None  # thumbnail of the last compared frame
+        self._last_result: dict | None = None
         self._bg_subtractor = cv2.createBackgroundSubtractorMOG2() if mode == "bg_sub" else None
         logging.debug("ImageComparator initialized with mode=%s", mode)
 
+        if HAVE_NUMBA and mode == "frame_diff":
+            # compile now so the first compare() in a demo loop doesn't pay for it
+            tiny = np.zeros((2, 2), np.uint8)
+            _diff_threshold_nb(tiny, tiny, DIFF_PIXEL_THRESHOLD, tiny.copy())
+
     def compare(self, frame: np.ndarray) -> dict:
         """
         Compare the given frame to detect motion.
 
         Returns a dict with keys: mode, motion_mask, motion_score, bboxes, alarm.
         """
+        if self.skip_static:
+            return self._compare_unless_static(frame)
+        return self._compare_scaled(frame)
+
+    def _compare_unless_static(self, frame: np.ndarray) -> dict:
+        fh, fw = frame.shape[:2]
+        tw = min(STATIC_THUMB_W, fw)
+        th = max(1, int(round(fh * tw / fw)))
+        thumb = cv2.cvtColor(
+            cv2.resize(frame, (tw, th), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY
+        )
+        last = self._last_result
+        # The reference thumbnail is only replaced when compare actually runs,
+        # so slow drift accumulates until it crosses the threshold.
+        if (
+            last is not None
+            and not last["bboxes"]
+            and self._thumb is not None
+            and self._thumb.shape == thumb.shape
+            and int(cv2.absdiff(self._thumb, thumb).max()) <= STATIC_THUMB_MAX_DIFF
+        ):
+            return last
+        result = self._compare_scaled(frame)
+        self._thumb = thumb
+        self._last_result = result
+        return result
+
+    def _compare_scaled(self, frame: np.ndarray) -> dict:
+        fh, fw = frame.shape[:2]
+        if self.proc_width is None or fw <= self.proc_width:
+            self._area_scale = 1.0
+            return self._compare(frame)
+
+        pw = self.proc_width
+        ph = max(1, int(round(fh * pw / fw)))
+        if self._small is None or self._small.shape[:2] != (ph, pw):
+            self._small = np.empty((ph, pw) + frame.shape[2:], dtype=frame.dtype)
+        cv2.resize(frame, (pw, ph), dst=self._small, interpolation=self.proc_interp)
+
+        sx = fw / pw
+        sy = fh / ph
+        self._area_scale = 1.0 / (sx * sy)
+        result = self._compare(self._small)
+        if result["bboxes"]:
+            # one broadcast over all boxes: x/y truncated, w/h rounded
+            bb = np.asarray(result["bboxes"], dtype=np.float64)
+            bb *= (sx, sy, sx, sy)
+            np.trunc(bb[:, :2], out=bb[:, :2])
+            np.rint(bb[:, 2:], out=bb[:, 2:])
+            result["bboxes"] = list(map(tuple, bb.astype(np.int32).tolist()))
+        return result
+
+    def _compare(self, frame: np.ndarray) -> dict:
         if self.mode == "frame_diff":
             return self._compare_frame_diff(frame)
         return self._compare_bg_sub(frame)
@@ -57,14 +165,20 @@ class ImageComparator:
                 "alarm": False,
             }
 
-        diff = cv2.absdiff(self._prev_gray, gray)
-        _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
+        if HAVE_NUMBA:
+            if self._thresh is None or self._thresh.shape != gray.shape:
+                self._thresh = np.empty_like(gray)
+            _diff_threshold_nb(self._prev_gray, gray, DIFF_PIXEL_THRESHOLD, self._thresh)
+            thresh = self._thresh
+        else:
+            diff = cv2.absdiff(self._prev_gray, gray)
+            _, thresh = cv2.threshold(diff, DIFF_PIXEL_THRESHOLD, 255, cv2.THRESH_BINARY)
         thresh = cv2.dilate(thresh, None, iterations=2)
 
         contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         bboxes: List[Tuple[int, int, int, int]] = []
         for c in contours:
-            if cv2.contourArea(c) < self.min_area:
+            if cv2.contourArea(c) < self.min_area * self._area_scale:
                 continue
             x, y, w, h = cv2.boundingRect(c)
             bboxes.append((x, y, w, h))
@@ -94,7 +208,7 @@ class ImageComparator:
         contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         bboxes: List[Tuple[int, int, int, int]] = []
         for c in contours:
-            if cv2.contourArea(c) < self.min_area:
+            if cv2.contourArea(c) < self.min_area * self._area_scale:
                 continue
             x, y, w, h = cv2.boundingRect(c)
             bboxes.append((x, y, w, h))
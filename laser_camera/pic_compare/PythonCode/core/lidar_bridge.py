@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import sys
+import threading
 import time
 
 # --- sys.path fix so we can import new_lidar from lidar_distance ---
@@ -50,6 +51,35 @@ def read_lidar_once() -> LidarSnapshot:
         return LidarSnapshot(ok=False, distance_cm=None, error=str(e), timestamp=ts)
 
 
+class LidarPoller:
+    """
+    Background LiDAR reader.
+
+    Calls read_lidar_once() every `interval_s` in a daemon thread and
+    publishes the newest LidarSnapshot in `latest` (a single reference
+    assignment), so a frame loop can read it without ever blocking on the
+    serial port. `latest` is None until the first read completes.
+    """
+
+    def __init__(self, interval_s: float = 0.2) -> None:
+        self.interval_s = interval_s
+        self.latest: LidarSnapshot | None = None
+        self.stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self._thread.join(timeout=1.0)
+
+    def _loop(self) -> None:
+        while not self.stop_event.is_set():
+            self.latest = read_lidar_once()
+            self.stop_event.wait(self.interval_s)
+
+
 if __name__ == "__main__":
     print("[LIDAR_BRIDGE] self-test: call read_lidar_once() 3 times")
     for i in range(3):
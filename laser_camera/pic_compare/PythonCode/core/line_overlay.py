@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Pre-rendered yellow-line overlay.
+
+The yellow line and its "YELLOW LINE" label are fixed for a whole session,
+so they are rasterized once and blitted onto every frame:
+
+    overlay, mask, roi = build_static_overlay(w, h, p1, p2)
+    cv2.copyTo(overlay, mask, vis[roi])
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+LINE_COLOR = (0, 255, 255)  # BGR yellow
+
+
+def build_static_overlay(w: int, h: int,
+                         p1: Tuple[float, float],
+                         p2: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray, Tuple[slice, slice]]:
+    """
+    黄线 + "YELLOW LINE" 标签整个会话不变：只栅格化一次。
+    返回 (overlay, mask, roi)，只覆盖黄线所在的外接矩形，每帧
+    cv2.copyTo(overlay, mask, vis[roi]) 贴上即可。
+    mask 在 50% 覆盖处截断（与 core.text_cache 相同）。
+    """
+    coverage = np.zeros((h, w), np.uint8)
+    cv2.line(coverage, (int(p1[0]), int(p1[1])), (int(p2[0]), int(p2[1])), 255, 3)
+    cv2.putText(coverage, "YELLOW LINE", (int(p1[0]) + 10, int(p1[1]) - 10),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.8, 255, 2)
+    bx, by, bw, bh = cv2.boundingRect(coverage)
+    roi = (slice(by, by + bh), slice(bx, bx + bw))
+    mask = (coverage[roi] >= 128).astype(np.uint8)
+    overlay = np.empty((bh, bw, 3), np.uint8)
+    overlay[:] = LINE_COLOR
+    return overlay, mask, roi
+
+
+if __name__ == "__main__":
+    img = np.zeros((432, 768, 3), np.uint8)
+    ov, m, r = build_static_overlay(768, 432, (50.0, 300.0), (700.0, 260.0))
+    cv2.copyTo(ov, m, img[r])
+    print(f"[LINE_OVERLAY] roi={r} mask_px={int(m.sum())} drawn_px={int((img[..., 2] > 0).sum())}")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Real-time scheduling helpers for the vision / LiDAR tick loops.
+
+pin_and_raise() pins the *calling* thread to one CPU core and switches it to
+SCHED_FIFO so that camera-decode worker threads cannot preempt the
+safety-critical path.
+
+Requirements:
+  - Linux only (os.sched_setaffinity / os.sched_setscheduler).
+  - Root, or the CAP_SYS_NICE capability for SCHED_FIFO, e.g.:
+        sudo setcap cap_sys_nice+ep "$(readlink -f "$(which python3)")"
+
+On other platforms, or without the privilege, the call silently does nothing
+and the thread keeps the default scheduler.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def pin_and_raise(cpu: int, prio: int = 80) -> bool:
+    """
+    Raise the calling thread to SCHED_FIFO priority `prio`, then pin it to `cpu`.
+
+    The scheduler is switched first: if that is refused (no root /
+    CAP_SYS_NICE) the thread is left completely untouched instead of being
+    pinned to a single core at normal priority. `cpu` must be in the thread's
+    current affinity set; otherwise nothing is changed.
+
+    Returns:
+        True if both priority and affinity were applied, False otherwise.
+    """
+    if not hasattr(os, "sched_setaffinity") or not hasattr(os, "sched_setscheduler"):
+        return False
+
+    # pid 0 = calling thread on Linux
+    try:
+        if cpu not in os.sched_getaffinity(0):
+            return False
+        old_policy = os.sched_getscheduler(0)
+        old_param = os.sched_getparam(0)
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(prio))
+    except (OSError, ValueError):  # PermissionError when not root / no CAP_SYS_NICE
+        return False
+
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except (OSError, ValueError):
+        # undo the priority change so a failure leaves the thread as it was
+        try:
+            os.sched_setscheduler(0, old_policy, old_param)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    ok = pin_and_raise(cpu=0, prio=10)
+    print(f"[RT_UTIL] pin_and_raise(cpu=0, prio=10) -> {ok}")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Background reader for RTSP (or any cv2.VideoCapture-like) sources.
+
+    reader = RtspReader(cap)
+    reader.start()
+    frame = reader.latest()   # newest decoded frame, or None on timeout
+    reader.stop()
+
+cap.read() blocks on the network and on H.264 decode; running it in a
+daemon thread lets the frame loop (fusion, LiDAR, drawing) proceed while
+the next frame is being decoded. Only the newest frame is kept.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+class RtspReader:
+    """
+    Calls cap.read() in a daemon thread and publishes the newest frame in a
+    single slot. latest() waits for a frame the consumer has not seen yet.
+
+    Each frame is a fresh array from cap.read(), so the consumer may draw on
+    the one it got while the reader decodes the next (no shared buffers).
+    """
+
+    def __init__(self, cap) -> None:
+        self.cap = cap
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._new_frame = threading.Event()
+        self._latest: Optional[np.ndarray] = None
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self._thread.join(timeout=1.0)
+
+    def latest(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """Newest unseen frame; None if none arrived within `timeout` seconds."""
+        if not self._new_frame.wait(timeout):
+            return None
+        with self._lock:
+            self._new_frame.clear()
+            return self._latest
+
+    def _loop(self) -> None:
+        while not self.stop_event.is_set():
+            ok, frame = self.cap.read()
+            if not ok or frame is None:
+                self.stop_event.wait(0.05)
+                continue
+            with self._lock:
+                self._latest = frame
+                self._new_frame.set()
+
+
+if __name__ == "__main__":
+    import time
+
+    class _FakeCap:
+        def __init__(self) -> None:
+            self.n = 0
+
+        def read(self):
+            time.sleep(0.01)
+            self.n += 1
+            return True, np.full((2, 2), self.n % 256, np.uint8)
+
+    r = RtspReader(_FakeCap())
+    r.start()
+    for _ in range(3):
+        f = r.latest()
+        print(f"[RTSP_READER] frame value={None if f is None else int(f[0, 0])}")
+        time.sleep(0.05)
+    r.stop()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cached cv2.putText for per-frame overlays.
+
+put_text_cached(img, text, org, scale, color, thickness) draws like
+cv2.putText with FONT_HERSHEY_SIMPLEX, but rasterizes each distinct
+label only once.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import cv2
+import numpy as np
+
+# Rasterized overlay labels, keyed by (text, scale, color, thickness).
+# putText strokes every glyph on every call; overlay labels rarely change,
+# so each one is drawn once and blitted with cv2.copyTo afterwards.
+TEXT_CACHE_MAX = 64
+_TEXT_CACHE: Dict[Tuple[str, float, Tuple[int, int, int], int], Tuple[np.ndarray, np.ndarray, int]] = {}
+
+
+def _text_tile(
+    text: str, scale: float, color: Tuple[int, int, int], thickness: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    (tile, mask, ascent) for one label. The anti-aliased glyph edge is cut
+    at 50% coverage, so the blit is a plain masked copy.
+    The least recently used entry is evicted past TEXT_CACHE_MAX.
+    """
+    key = (text, scale, color, thickness)
+    hit = _TEXT_CACHE.pop(key, None)
+    if hit is None:
+        (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+        ascent = th + thickness
+        coverage = np.zeros((ascent + baseline + thickness, tw + 2 * thickness), np.uint8)
+        cv2.putText(coverage, text, (thickness, ascent), cv2.FONT_HERSHEY_SIMPLEX, scale, 255, thickness)
+        mask = (coverage >= 128).astype(np.uint8)
+        tile = np.empty(mask.shape + (3,), np.uint8)
+        tile[:] = color
+        hit = (tile, mask, ascent)
+        if len(_TEXT_CACHE) >= TEXT_CACHE_MAX:
+            _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+    _TEXT_CACHE[key] = hit  # re-insert: dict order doubles as LRU order
+    return hit
+
+
+def put_text_cached(
+    img: np.ndarray,
+    text: str,
+    org: Tuple[int, int],
+    scale: float,
+    color: Tuple[int, int, int],
+    thickness: int,
+) -> None:
+    """Stand-in for cv2.putText(img, text, org, FONT_HERSHEY_SIMPLEX, scale, color, thickness)."""
+    tile, mask, ascent = _text_tile(text, scale, color, thickness)
+    x0 = org[0] - thickness
+    y0 = org[1] - ascent
+    h, w = img.shape[:2]
+    # clip the tile to the image
+    tx0, ty0 = max(0, -x0), max(0, -y0)
+    x1 = min(w, x0 + mask.shape[1])
+    y1 = min(h, y0 + mask.shape[0])
+    x0, y0 = max(0, x0), max(0, y0)
+    if x1 <= x0 or y1 <= y0:
+        return
+    th, tw = y1 - y0, x1 - x0
+    cv2.copyTo(
+        tile[ty0:ty0 + th, tx0:tx0 + tw],
+        mask[ty0:ty0 + th, tx0:tx0 + tw],
+        img[y0:y1, x0:x1],
+    )
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import List
 
+import numpy as np
+
+from core.yellow_line_logic import ZONE_INDEX
 from core.yellow_line_tracker import LineZone
 
+# moving on the line closer than this (px) -> CAUTION
+ON_LINE_MOTION_DIST_PX = 10.0
+
 
 class SafetyLevel(Enum):
     SAFE = auto()
@@ -12,7 +19,7 @@ class SafetyLevel(Enum):
     DANGER = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class VisionSafetyDecision:
     level: SafetyLevel
     output_enabled: bool   # True -> trigger safety output/relay (alarm/cut-off)
@@ -37,7 +44,7 @@ def evaluate_vision_safety(
         )
 
     if zone == LineZone.ON_LINE_SAFE:
-        if has_motion and dist_to_line < 10.0:
+        if has_motion and dist_to_line < ON_LINE_MOTION_DIST_PX:
             return VisionSafetyDecision(
                 level=SafetyLevel.CAUTION,
                 output_enabled=True,
@@ -60,6 +67,35 @@ def evaluate_vision_safety(
     )
 
 
+# One decision per distinct outcome, indexed by evaluate_vision_safety_batch().
+_BATCH_DECISIONS = (
+    evaluate_vision_safety(LineZone.OUTSIDE_SAFE, 0.0, False),
+    evaluate_vision_safety(LineZone.ON_LINE_SAFE, 0.0, False),
+    evaluate_vision_safety(LineZone.ON_LINE_SAFE, 0.0, True),
+    evaluate_vision_safety(LineZone.INSIDE_DANGER, 0.0, False),
+)
+_ON_LINE_ORD = ZONE_INDEX[LineZone.ON_LINE_SAFE]
+_DANGER_ORD = ZONE_INDEX[LineZone.INSIDE_DANGER]
+
+
+def evaluate_vision_safety_batch(
+    zone_idx: np.ndarray,
+    dists: np.ndarray,
+    has_motion: np.ndarray,
+) -> List[VisionSafetyDecision]:
+    """
+    Vectorised evaluate_vision_safety() over whole arrays (e.g. a replayed log).
+
+    zone_idx indexes yellow_line_logic.ZONES (see ZONE_INDEX). Equal outcomes
+    share one (frozen) VisionSafetyDecision instance.
+    """
+    on_line = zone_idx == _ON_LINE_ORD
+    caution = on_line & has_motion & (dists < ON_LINE_MOTION_DIST_PX)
+    # 0 outside, 1 on-line safe, 2 on-line caution, 3 danger
+    idx = np.where(zone_idx == _DANGER_ORD, 3, on_line.astype(np.int8) + caution)
+    return [_BATCH_DECISIONS[i] for i in idx.tolist()]
+
+
 if __name__ == "__main__":
     # Simple self-test
     cases = [
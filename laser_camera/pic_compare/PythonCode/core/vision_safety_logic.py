@@ -9,42 +9,31 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List, Tuple, Optional
+from enum import IntEnum
+from typing import List, Tuple, Optional, Union
 
-try:
-    from core.distance_compare_geometry import (
-        build_line_points_from_config,
-        foot_from_bbox,
-        signed_distance_to_line,
-        classify_distance_zone,
-    )
-except ImportError:
-    from core.distance_compare_geometry import (  # type: ignore
-        build_line_points_from_config,
-        signed_distance_to_line,
-        classify_distance_zone,
-    )
+import numpy as np
 
-    def foot_from_bbox(bbox: Tuple[int, int, int, int]) -> Tuple[float, float]:
-        x, y, w, h = bbox
-        return x + w / 2.0, y + h
+from core.distance_compare_geometry import (
+    build_line_points_from_config,
+    line_coefficients,
+)
 from core import config
 
 
-class SafetyLevel(Enum):
-    SAFE = auto()
-    CAUTION = auto()
-    DANGER = auto()
+class SafetyLevel(IntEnum):
+    SAFE = 0
+    CAUTION = 1
+    DANGER = 2
 
 
-class SafetyZone(Enum):
-    OUTSIDE_SAFE = auto()
-    ON_LINE = auto()
-    INSIDE_DANGER = auto()
+class SafetyZone(IntEnum):
+    OUTSIDE_SAFE = 0
+    ON_LINE = 1
+    INSIDE_DANGER = 2
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VisionSafetyResult:
     level: SafetyLevel
     zone: SafetyZone
@@ -53,6 +42,32 @@ class VisionSafetyResult:
     primary_bbox: Optional[Tuple[int, int, int, int]] = None
 
 
+# _zone_index() result -> (level, zone)
+_ZONE_RESULT = (
+    (SafetyLevel.SAFE, SafetyZone.OUTSIDE_SAFE),
+    (SafetyLevel.CAUTION, SafetyZone.ON_LINE),
+    (SafetyLevel.DANGER, SafetyZone.INSIDE_DANGER),
+)
+
+# (N, 4) int32 array of (x, y, w, h), or the legacy list of tuples
+BBoxArray = Union[np.ndarray, List[Tuple[int, int, int, int]]]
+
+
+def bboxes_to_array(bboxes: BBoxArray) -> np.ndarray:
+    """
+    Pack detections into one contiguous (N, 4) int32 array of (x, y, w, h)
+    (16 bytes per box; int32 so no image coordinate can wrap).
+
+    Arrays pass through (cast only if not int32); lists of tuples from
+    legacy callers are flattened with np.fromiter.
+    """
+    if isinstance(bboxes, np.ndarray):
+        return bboxes.astype(np.int32, copy=False).reshape(-1, 4)
+    return np.fromiter(
+        (v for box in bboxes for v in box), dtype=np.int32, count=4 * len(bboxes)
+    ).reshape(-1, 4)
+
+
 class VisionSafetyLogic:
     """
     High-level vision safety logic.
@@ -67,43 +82,60 @@ class VisionSafetyLogic:
         self.line_p1, self.line_p2 = build_line_points_from_config(
             frame_width, frame_height, self.dist_cfg
         )
+        # normalized line coefficients, cached as plain floats:
+        # d = a*x + b*y + c  (d > 0 => safe side, same as signed_distance_to_line)
+        self._a, self._b, self._c = line_coefficients(self.line_p1, self.line_p2)
+
+        # zone thresholds (px), read once from config
+        self._safe_far = float(self.dist_cfg.safe_far_threshold_px)
+        self._on_line_tol = float(self.dist_cfg.on_line_tolerance_px)
+        self._danger_inside = float(self.dist_cfg.danger_inside_threshold_px)
+
+    def _zone_index(self, d: float) -> int:
+        """
+        Same thresholds as classify_distance_zone, as plain compares:
+        0 = OUTSIDE_SAFE, 1 = ON_LINE, 2 = INSIDE_DANGER.
+        """
+        inside = (d <= -self._danger_inside) & (d < -self._on_line_tol)
+        return 1 + inside - (d >= self._safe_far)
 
     def evaluate_distance(
         self,
-        bboxes: List[Tuple[int, int, int, int]],
+        bboxes: BBoxArray,
         motion_score: float,
     ) -> Tuple[SafetyLevel, SafetyZone, float, Optional[Tuple[int, int, int, int]]]:
-        """Distance-based safety evaluation."""
-        if not bboxes:
+        """
+        Distance-based safety evaluation.
+
+        bboxes: (N, 4) int32 array of (x, y, w, h); a list of tuples is
+        converted here via bboxes_to_array (no copy for int32 arrays).
+        """
+        boxes = bboxes_to_array(bboxes)
+        if boxes.shape[0] == 0:
             return SafetyLevel.SAFE, SafetyZone.OUTSIDE_SAFE, 0.0, None
 
-        # pick main bbox: lowest foot
-        primary = max(bboxes, key=lambda b: b[1] + b[3])
-        fx, fy = foot_from_bbox(primary)
-        d = signed_distance_to_line((fx, fy), self.line_p1, self.line_p2)
-        zone_text = classify_distance_zone(d, self.dist_cfg)
-
-        if zone_text in ("OUTSIDE_SAFE", "NEAR_LINE"):
-            level = SafetyLevel.SAFE
-            zone = SafetyZone.OUTSIDE_SAFE
-        elif zone_text == "ON_LINE":
-            level = SafetyLevel.CAUTION
-            zone = SafetyZone.ON_LINE
-        else:
-            level = SafetyLevel.DANGER
-            zone = SafetyZone.INSIDE_DANGER
+        # signed distance of every foot (bottom-center) in one pass
+        fx = boxes[:, 0] + boxes[:, 2] * 0.5
+        fy = boxes[:, 1] + boxes[:, 3]
+        dists = self._a * fx + self._b * fy + self._c
 
+        # primary bbox = the foot deepest towards the danger side (min d)
+        idx = int(np.argmin(dists))
+        primary = tuple(boxes[idx].tolist())
+        d = float(dists[idx])
+        level, zone = _ZONE_RESULT[self._zone_index(d)]
         return level, zone, d, primary
 
     def evaluate(
         self,
         frame_shape: Tuple[int, int, int],
-        bboxes: List[Tuple[int, int, int, int]],
+        bboxes: BBoxArray,
     ) -> VisionSafetyResult:
         """Public entry: wrapper around distance-based evaluation."""
         # motion_score currently unused in mapping, but passed for future use
         motion_score = 0.0
-        level, zone, d, primary_bbox = self.evaluate_distance(bboxes, motion_score)
+        boxes = bboxes_to_array(bboxes)
+        level, zone, d, primary_bbox = self.evaluate_distance(boxes, motion_score)
         return VisionSafetyResult(
             level=level,
             zone=zone,
@@ -144,3 +176,35 @@ if __name__ == "__main__":
             f"-> level={res.level.name} zone={res.zone.name} "
             f"d={res.geom_distance_px:6.2f}px bbox={res.primary_bbox}"
         )
+
+    # cross-check against the per-box geometry path (min d over all feet,
+    # boxes may extend past the frame edge like raw motion boxes do)
+    from core.distance_compare_geometry import (
+        classify_distance_zone,
+        foot_from_bbox,
+        signed_distance_to_line,
+    )
+
+    zone_by_text = {
+        "OUTSIDE_SAFE": SafetyZone.OUTSIDE_SAFE,
+        "ON_LINE": SafetyZone.ON_LINE,
+        "INSIDE_DANGER": SafetyZone.INSIDE_DANGER,
+    }
+    rng = np.random.default_rng(0)
+    mismatches = 0
+    n_cases = 2000
+    for _ in range(n_cases):
+        n = int(rng.integers(1, 8))
+        boxes = [
+            (int(rng.integers(-200, fw)), int(rng.integers(-200, fh)),
+             int(rng.integers(5, 500)), int(rng.integers(5, 700)))
+            for _ in range(n)
+        ]
+        ds = [signed_distance_to_line(foot_from_bbox(b), logic.line_p1, logic.line_p2) for b in boxes]
+        i = int(np.argmin(ds))
+        want_zone = zone_by_text[classify_distance_zone(ds[i], logic.dist_cfg)]
+        res = logic.evaluate(frame_shape, boxes)
+        if (res.primary_bbox != boxes[i] or res.zone != want_zone
+                or abs(res.geom_distance_px - ds[i]) > 1e-6):
+            mismatches += 1
+    print(f"[TEST] per-box cross-check: {n_cases} cases, mismatches={mismatches}")
@@ -2,8 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from math import hypot as _hypot
 from typing import Tuple
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the kernels below run as plain Python
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if args and callable(args[0]):  # bare @njit
+            return args[0]
+
+        def _wrap(fn):
+            return fn
+        return _wrap
+
 
 class LineZone(str, Enum):
     """
@@ -19,7 +31,13 @@ class LineZone(str, Enum):
     INSIDE_DANGER = "INSIDE_DANGER"
 
 
-@dataclass
+# zone index returned by the numeric kernels -> LineZone
+ZONES = (LineZone.OUTSIDE_SAFE, LineZone.ON_LINE_SAFE, LineZone.INSIDE_DANGER)
+# LineZone -> kernel index (inverse of ZONES)
+ZONE_INDEX = {zone: i for i, zone in enumerate(ZONES)}
+
+
+@dataclass(slots=True)
 class YellowLineModel:
     """
     Mathematical model of the yellow safety line.
@@ -44,9 +62,7 @@ class YellowLineModel:
 
     def normalize(self) -> None:
         """Normalize (a, b, c) so that sqrt(a^2 + b^2) == 1."""
-        import math
-
-        norm = math.hypot(self.a, self.b)
+        norm = _hypot(self.a, self.b)
         if norm == 0:
             raise ValueError("Invalid yellow line parameters: a and b cannot both be zero.")
 
@@ -55,6 +71,21 @@ class YellowLineModel:
         self.c /= norm
 
 
+@njit(fastmath=True)
+def classify_point_kernel(a, b, c, eps, sign, x, y):
+    """
+    Numeric core of classify_point (plain floats in and out, so jitted
+    callers such as yellow_line_tracker can use it directly).
+
+    sign: +1.0 if the positive side of the line is safe, -1.0 otherwise.
+    Returns (zone_idx, dist, is_safe); zone_idx indexes ZONES.
+    """
+    dist = sign * (a * x + b * y + c)
+    # branchless: 0 above the band, 1 inside [-eps, eps], 2 below it
+    zone_idx = int(dist <= eps) + int(dist < -eps)
+    return zone_idx, dist, dist >= -eps
+
+
 def classify_point(
     model: YellowLineModel,
     x: float,
@@ -68,23 +99,12 @@ def classify_point(
         dist:     signed distance on the "safe coordinate" ( >0 safe side, <0 danger side )
         is_safe:  True if the point is considered safe (OUTSIDE_SAFE or ON_LINE_SAFE)
     """
-    # raw signed distance with respect to the model line
-    raw_d = model.a * x + model.b * y + model.c
-
-    # Re-orient distance so that dist > 0 always means "safe side"
-    dist = raw_d if model.safe_side_positive else -raw_d
-
-    if -model.epsilon <= dist <= model.epsilon:
-        zone = LineZone.ON_LINE_SAFE
-        is_safe = True
-    elif dist > model.epsilon:
-        zone = LineZone.OUTSIDE_SAFE
-        is_safe = True
-    else:
-        zone = LineZone.INSIDE_DANGER
-        is_safe = False
-
-    return zone, dist, is_safe
+    # dist > 0 always means "safe side" after the sign flip
+    sign = 1.0 if model.safe_side_positive else -1.0
+    zone_idx, dist, is_safe = classify_point_kernel(
+        model.a, model.b, model.c, model.epsilon, sign, float(x), float(y)
+    )
+    return ZONES[zone_idx], dist, is_safe
 
 
 def _demo() -> None:
@@ -1,10 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from .yellow_line_logic import YellowLineModel, LineZone, classify_point
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the kernels below run as plain Python
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if args and callable(args[0]):  # bare @njit
+            return args[0]
+
+        def _wrap(fn):
+            return fn
+        return _wrap
+
+from .yellow_line_logic import (
+    YellowLineModel,
+    LineZone,
+    ZONES,
+    ZONE_INDEX,
+    classify_point_kernel,
+)
 
 
 class LineState(str, Enum):
@@ -20,7 +39,32 @@ class LineState(str, Enum):
     DANGER_STABLE = "DANGER_STABLE"
 
 
-@dataclass
+# state index returned by _tracker_step_nb -> LineState
+_STATES = (LineState.TRANSITION, LineState.SAFE_STABLE, LineState.DANGER_STABLE)
+
+
+@njit
+def _tracker_step_nb(zone_idx, last_zone_idx, stable_count, stable_frames):
+    """
+    Numeric core of YellowLineTracker.update.
+
+    Zone indices follow yellow_line_logic.ZONES (2 == INSIDE_DANGER),
+    last_zone_idx == -1 means "no previous frame".
+    Returns (stable_count, state_idx); state_idx indexes _STATES.
+    """
+    if zone_idx == last_zone_idx:
+        stable_count += 1
+    else:
+        stable_count = 1
+
+    if stable_count >= stable_frames:
+        state_idx = 2 if zone_idx == 2 else 1
+    else:
+        state_idx = 0
+    return stable_count, state_idx
+
+
+@dataclass(slots=True)
 class TrackerConfig:
     """
     Configuration for the yellow line state tracker.
@@ -31,19 +75,23 @@ class TrackerConfig:
     stable_frames: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class YellowLineTracker:
     """
     Simple tracker that consumes a stream of foot positions and produces
     a high-level state (SAFE_STABLE / DANGER_STABLE / TRANSITION).
     """
     model: YellowLineModel
-    config: TrackerConfig = TrackerConfig()
+    config: TrackerConfig = field(default_factory=TrackerConfig)
 
     last_zone: Optional[LineZone] = None
     stable_count: int = 0
     state: LineState = LineState.TRANSITION
 
+    def _last_zone_index(self) -> int:
+        """Kernel index of last_zone, -1 before the first frame."""
+        return -1 if self.last_zone is None else ZONE_INDEX[self.last_zone]
+
     def update(self, x: float, y: float) -> Tuple[LineState, LineZone, float, bool]:
         """
         Update the tracker with a new foot position.
@@ -54,24 +102,72 @@ class YellowLineTracker:
             dist:    signed distance on the safe coordinate
             is_safe: True if the current frame is safe
         """
-        zone, dist, is_safe = classify_point(self.model, x, y)
-
-        if self.last_zone == zone:
-            self.stable_count += 1
-        else:
-            self.last_zone = zone
-            self.stable_count = 1
-
-        if self.stable_count >= self.config.stable_frames:
-            if zone == LineZone.INSIDE_DANGER:
-                self.state = LineState.DANGER_STABLE
-            else:
-                self.state = LineState.SAFE_STABLE
-        else:
-            self.state = LineState.TRANSITION
+        m = self.model
+        sign = 1.0 if m.safe_side_positive else -1.0
+        zone_idx, dist, is_safe = classify_point_kernel(
+            m.a, m.b, m.c, m.epsilon, sign, float(x), float(y)
+        )
+        self.stable_count, state_idx = _tracker_step_nb(
+            zone_idx, self._last_zone_index(), self.stable_count, self.config.stable_frames
+        )
+
+        zone = ZONES[zone_idx]
+        self.last_zone = zone
+        self.state = _STATES[state_idx]
 
         return self.state, zone, dist, is_safe
 
+    def update_batch(self, xs: np.ndarray, ys: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized equivalent of calling update(x, y) for every (xs[i], ys[i])
+        in order, e.g. when replaying a recorded trajectory offline.
+
+        The tracker continues from its current state and ends in the same
+        state a per-frame loop would leave it in.
+
+        Returns a dict of per-frame arrays:
+            "state":   int8 indices into _STATES
+            "zone":    int8 indices into ZONES
+            "dist":    signed distance on the safe coordinate
+            "is_safe": bool
+        """
+        m = self.model
+        sign = 1.0 if m.safe_side_positive else -1.0
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        dist = sign * (m.a * xs + m.b * ys + m.c)
+        zones = (dist <= m.epsilon).astype(np.int8) + (dist < -m.epsilon)
+        n = zones.shape[0]
+        if n == 0:
+            empty = np.empty(0, dtype=np.int8)
+            return {"state": empty, "zone": empty, "dist": dist, "is_safe": dist >= -m.epsilon}
+
+        # run-length of the current zone: frames since the last zone change
+        change = np.empty(n, dtype=bool)
+        change[0] = zones[0] != self._last_zone_index()
+        change[1:] = zones[1:] != zones[:-1]
+        frame = np.arange(n)
+        run_start = np.maximum.accumulate(np.where(change, frame, 0))
+        counts = frame - run_start + 1
+        if not change[0]:
+            # first run continues the streak carried over from earlier frames
+            counts[run_start == 0] += self.stable_count
+
+        stable = counts >= self.config.stable_frames
+        states = np.where(stable, np.where(zones == 2, 2, 1), 0).astype(np.int8)
+
+        self.last_zone = ZONES[int(zones[-1])]
+        self.stable_count = int(counts[-1])
+        self.state = _STATES[int(states[-1])]
+
+        return {
+            "state": states,
+            "zone": zones,
+            "dist": dist,
+            "is_safe": dist >= -m.epsilon,
+        }
+
 
 def _demo_tracker() -> None:
     """
@@ -100,6 +196,14 @@ def _demo_tracker() -> None:
         state, zone, dist, is_safe = tracker.update(x, y)
         print(f"[S2] frame={i}, state={state.value}, zone={zone.value}, safe={is_safe}")
 
+    # Scenario 3: same trajectory in one batch call
+    print("\nScenario 3: batch replay of scenario 2")
+    tracker = YellowLineTracker(model, TrackerConfig(stable_frames=2))
+    xs, ys = np.array(danger_points, dtype=np.float64).T
+    out = tracker.update_batch(xs, ys)
+    for i, (st, zn) in enumerate(zip(out["state"], out["zone"])):
+        print(f"[S3] frame={i}, state={_STATES[st].value}, zone={ZONES[zn].value}, safe={out['is_safe'][i]}")
+
 
 if __name__ == "__main__":
     _demo_tracker()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import sys
 from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -34,13 +35,25 @@ def analyze_vision_log() -> None:
     zone_counter: Counter[str] = Counter()
 
     with LOG_PATH.open("r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            total_records += 1
-            level = row.get("safety_level", "UNKNOWN")
-            zone = row.get("zone", "UNKNOWN")
-            level_counter[level] += 1
-            zone_counter[zone] += 1
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        # (level, zone) per row; a missing column counts as UNKNOWN
+        getters = [
+            itemgetter(header.index(col)) if col in header else (lambda _r: "UNKNOWN")
+            for col in ("safety_level", "zone")
+        ]
+        get_level, get_zone = getters
+        # count (level, zone) pairs in one pass, then fold per column;
+        # short rows (e.g. a truncated last line from a batched writer) are skipped
+        n_cols = len(header)
+        pair_counter: Counter[tuple[str, str]] = Counter(
+            (get_level(row), get_zone(row)) for row in reader if len(row) >= n_cols
+        )
+
+    for (level, zone), count in pair_counter.items():
+        total_records += count
+        level_counter[level] += count
+        zone_counter[zone] += count
 
     if total_records == 0:
         print("[INFO] vision_log.csv is empty.")
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Tuple
 
 import cv2
+import numpy as np
 
 # Ensure the project root (PythonCode) is on sys.path so we can import the sibling core package
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -14,6 +18,7 @@ if str(ROOT_DIR) not in sys.path:
 from core.vision_core import YellowLineVision, VisionConfig
 from core.yellow_line_logic import YellowLineModel
 from core.yellow_line_tracker import TrackerConfig, LineState, LineZone
+from core.camera_driver import open_usb_camera
 
 
 def build_yellow_line_model(frame_size: Tuple[int, int]) -> YellowLineModel:
@@ -41,8 +46,87 @@ def build_yellow_line_model(frame_size: Tuple[int, int]) -> YellowLineModel:
     return model
 
 
+# console status line at most once per LOG_INTERVAL_S (print blocks on flush)
+LOG_INTERVAL_S = 1.0
+
+
+# Drawing constants (BGR)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_COLOR_SAFE = (0, 255, 0)
+_COLOR_DANGER = (0, 0, 255)
+_COLOR_WHITE = (255, 255, 255)
+_COLOR_LINE = (0, 255, 255)
+_POS_STATE = (10, 30)
+_POS_ZONE = (10, 60)
+_POS_SAFE = (10, 90)
+
+# With no motion and an unchanged result the scene is static: keep showing the
+# last rendered frame, but repaint at least every N frames so it cannot go stale
+STATIC_REFRESH_FRAMES = 15
+
+# HUD strip in the top-left corner (rows, cols); text is drawn into it only
+# when the state / zone / safe flag changes
+TEXT_STRIP_SHAPE = (100, 300)
+
+
+def build_static_overlay(w: int, h: int, line_y: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize everything that does not change per frame (the yellow line)
+    once. Returns (overlay, mask); copy it in with cv2.copyTo(overlay, mask, frame).
+    """
+    overlay = np.zeros((h, w, 3), np.uint8)
+    cv2.line(overlay, (0, line_y), (w, line_y), _COLOR_LINE, 2)
+    mask = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
+    return overlay, mask
+
+
+def render_text_strip(result) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw the state / zone / SAFE lines into a small standalone image.
+    Returns (strip, mask); blend it in with cv2.copyTo(strip, mask, frame[roi])
+    so only the glyph pixels cover the video.
+    """
+    strip = np.zeros((*TEXT_STRIP_SHAPE, 3), np.uint8)
+    state_text = f"state: {result.line_state.value}"
+    zone_text = f"zone: {result.line_zone.value}"
+    safe_text = f"SAFE={result.is_safe}"
+
+    color = _COLOR_SAFE if result.is_safe else _COLOR_DANGER
+    cv2.putText(strip, state_text, _POS_STATE, _FONT, 0.7, color, 2)
+    cv2.putText(strip, zone_text, _POS_ZONE, _FONT, 0.6, _COLOR_WHITE, 2)
+    cv2.putText(strip, safe_text, _POS_SAFE, _FONT, 0.7, color, 2)
+    mask = cv2.cvtColor(strip, cv2.COLOR_BGR2GRAY)
+    return strip, mask
+
+
+def _reader_loop(
+    cap: cv2.VideoCapture,
+    frames: "queue.Queue[np.ndarray]",
+    stop: threading.Event,
+) -> None:
+    """
+    Capture thread: keep only the newest frame in `frames` (maxsize=1) so the
+    main thread never processes a stale one.
+    """
+    while not stop.is_set():
+        ret, frame = cap.read()
+        if not ret:
+            print("Failed to read frame from camera.")
+            stop.set()
+            break
+        try:
+            frames.put_nowait(frame)
+        except queue.Full:
+            # drop the unprocessed older frame, keep the latest
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            frames.put_nowait(frame)
+
+
 def main() -> None:
-    cap = cv2.VideoCapture(0)
+    cap = open_usb_camera(0)
     if not cap.isOpened():
         print("Failed to open camera 0. Please check your webcam or use a different index.")
         return
@@ -60,53 +144,85 @@ def main() -> None:
         tracker_cfg=TrackerConfig(stable_frames=3),
     )
 
+    # The line is static and horizontal: y = -c/b after normalization.
+    # Rasterize it once, outside the frame loop.
+    line_y = int(-line_model.c / line_model.b)
+    static_overlay, static_mask = build_static_overlay(w, h, line_y)
+    sh, sw = TEXT_STRIP_SHAPE
+    sh, sw = min(sh, h), min(sw, w)
+
     print("Starting motion + yellow-line demo. Press 'q' to quit.")
 
+    frames: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    reader = threading.Thread(target=_reader_loop, args=(cap, frames, stop), daemon=True)
+    reader.start()
+    last_log = 0.0
+    text_strip = text_mask = None
+    last_strip_key = None
+    last_result_key = None
+    frames_since_paint = 0
+
     while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("Failed to read frame from camera.")
-            break
+        try:
+            frame = frames.get(timeout=0.5)
+        except queue.Empty:
+            if stop.is_set():
+                break
+            continue
 
         result = vision.process_frame(frame)
 
+        result_key = (result.line_state, result.line_zone, result.is_safe, result.foot_point)
+        if (
+            not result.has_motion
+            and result_key == last_result_key
+            and frames_since_paint < STATIC_REFRESH_FRAMES
+        ):
+            # nothing new to show, but keep pumping the GUI so the window
+            # stays responsive and 'q' still quits while the scene is static
+            frames_since_paint += 1
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+            continue
+        last_result_key = result_key
+        frames_since_paint = 0
+
         # Draw yellow line (for visualization)
-        # The line is horizontal: y = -c/b  after normalization
-        line_y = int(-line_model.c / line_model.b)
-        cv2.line(frame, (0, line_y), (w, line_y), (0, 255, 255), 2)
+        cv2.copyTo(static_overlay, static_mask, frame)
 
         # Draw foot point if available
         if result.foot_point is not None:
             fx, fy = result.foot_point
-            cv2.circle(frame, (fx, fy), 6, (0, 0, 255), -1)
-
-        # Draw text info
-        state_text = f"state: {result.line_state.value}"
-        zone_text = f"zone: {result.line_zone.value}"
-        safe_text = f"SAFE={result.is_safe}"
+            cv2.circle(frame, (fx, fy), 6, _COLOR_DANGER, -1)
 
-        cv2.putText(frame, state_text, (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if result.is_safe else (0, 0, 255), 2)
-        cv2.putText(frame, zone_text, (10, 60),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        cv2.putText(frame, safe_text, (10, 90),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if result.is_safe else (0, 0, 255), 2)
+        # Draw text info (re-rendered only when it changes)
+        strip_key = (result.line_state, result.line_zone, result.is_safe)
+        if strip_key != last_strip_key:
+            text_strip, text_mask = render_text_strip(result)
+            last_strip_key = strip_key
+        cv2.copyTo(text_strip[:sh, :sw], text_mask[:sh, :sw], frame[:sh, :sw])
 
         cv2.imshow("motion_line_demo", frame)
 
-        # Also print to console for debugging
-        print(
-            f"state={result.line_state.value}, "
-            f"zone={result.line_zone.value}, "
-            f"dist={result.dist:.2f}, "
-            f"has_motion={result.has_motion}, "
-            f"SAFE={result.is_safe}"
-        )
+        # Also print to console for debugging (rate-limited)
+        now = time.monotonic()
+        if now - last_log >= LOG_INTERVAL_S:
+            last_log = now
+            print(
+                f"state={result.line_state.value}, "
+                f"zone={result.line_zone.value}, "
+                f"dist={result.dist:.2f}, "
+                f"has_motion={result.has_motion}, "
+                f"SAFE={result.is_safe}"
+            )
 
         key = cv2.waitKey(1) & 0xFF
         if key == ord("q"):
             break
 
+    stop.set()
+    reader.join(timeout=1.0)
     cap.release()
     cv2.destroyAllWindows()
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime
 from pathlib import Path
+import queue
 import sys
-from typing import Tuple
+import threading
+import time
+from typing import List, Tuple
 
 import cv2
 
@@ -16,6 +18,96 @@ if str(ROOT_DIR) not in sys.path:
 from core.vision_core import YellowLineVision, VisionConfig
 from core.yellow_line_logic import YellowLineModel
 from core.yellow_line_tracker import TrackerConfig
+from core.camera_driver import open_usb_camera
+
+
+# Decode only every FRAME_STRIDE-th camera frame (30 FPS camera -> 15 FPS);
+# skipped frames are grab()-ed but never converted to BGR.
+FRAME_STRIDE = 2
+
+# CSV rows are buffered and flushed at most this often (and on exit)
+CSV_FLUSH_INTERVAL_S = 2.0
+# rows waiting for the writer thread; beyond this, new rows are dropped
+CSV_QUEUE_MAX = 1024
+# rows written per writerows() call
+CSV_BATCH_MAX = 64
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_ts_prefix = [-1, ""]
+
+
+def iso_timestamp() -> str:
+    """
+    Local time as ISO 8601 with microseconds, e.g. 2024-05-01T13:45:07.123456.
+    The date/time prefix is formatted once per second; only the fraction
+    is rebuilt per call (no datetime object per row).
+    """
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _ts_prefix[0]:
+        _ts_prefix[0] = sec
+        _ts_prefix[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return "%s.%06d" % (_ts_prefix[1], ns // 1000)
+
+
+class CsvLogWriter:
+    """
+    Background CSV writer.
+
+    The frame loop only does put(row); a daemon thread drains the queue in
+    batches of up to CSV_BATCH_MAX rows and flushes every
+    CSV_FLUSH_INTERVAL_S, so disk stalls never block frame intake.
+    The writer owns csv_file: the thread closes it as its last step.
+    """
+
+    def __init__(self, csv_file) -> None:
+        self.csv_file = csv_file
+        self.writer = csv.writer(csv_file)
+        self.q: "queue.Queue[list]" = queue.Queue(maxsize=CSV_QUEUE_MAX)
+        self.stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def put(self, row: list) -> None:
+        try:
+            self.q.put_nowait(row)
+        except queue.Full:
+            print("[ERROR] CSV queue full, dropping row.")
+
+    def stop(self) -> None:
+        """Write out everything still queued, flush, close, and stop the thread."""
+        self.stop_event.set()
+        self._thread.join(timeout=5.0)
+        if self._thread.is_alive():
+            # still writing (slow disk): it closes the file itself when done
+            print("[WARN] CSV writer still busy after 5 s; file is closed when it finishes.")
+
+    def _loop(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            rows: List[list] = []
+            try:
+                rows.append(self.q.get(timeout=0.2))
+                while len(rows) < CSV_BATCH_MAX:
+                    rows.append(self.q.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                if rows:
+                    self.writer.writerows(rows)
+                now = time.monotonic()
+                if now - last_flush > CSV_FLUSH_INTERVAL_S:
+                    self.csv_file.flush()
+                    last_flush = now
+            except Exception as exc:
+                print(f"[ERROR] Failed to write CSV rows: {exc}")
+            if self.stop_event.is_set() and self.q.empty():
+                break
+        try:
+            self.csv_file.close()  # flushes
+        except Exception as exc:
+            print(f"[ERROR] Failed to close CSV: {exc}")
 
 
 def build_yellow_line_model(frame_size: Tuple[int, int]) -> YellowLineModel:
@@ -34,7 +126,7 @@ def build_yellow_line_model(frame_size: Tuple[int, int]) -> YellowLineModel:
 
 
 def main() -> None:
-    cap = cv2.VideoCapture(0)
+    cap = open_usb_camera(0)
     if not cap.isOpened():
         print("Failed to open camera 0. Please check your webcam or use a different index.")
         return
@@ -61,16 +153,30 @@ def main() -> None:
 
     # Prepare CSV writer (append mode). Write header if file is new/empty.
     write_header = not csv_path.exists() or csv_path.stat().st_size == 0
-    csv_file = csv_path.open("a", newline="", encoding="utf-8")
-    writer = csv.writer(csv_file)
+    csv_file = csv_path.open("a", newline="", encoding="utf-8", buffering=65536)
     if write_header:
-        writer.writerow(["timestamp", "line_state", "line_zone", "is_safe", "has_motion", "dist", "foot_x", "foot_y"])
+        csv.writer(csv_file).writerow(
+            ["timestamp", "line_state", "line_zone", "is_safe", "has_motion", "dist", "foot_x", "foot_y"]
+        )
+    log_writer = CsvLogWriter(csv_file)
+    log_writer.start()
+
+    # The line is static and horizontal: y = -c/b after normalization
+    line_y = int(-line_model.c / line_model.b)
+    line_p1, line_p2 = (0, line_y), (w, line_y)
 
     prev_state: Tuple[str, str, bool] | None = None
+    frame_counter = 0
 
     try:
         while True:
-            ret, frame = cap.read()
+            if not cap.grab():
+                print("Failed to read frame from camera.")
+                break
+            frame_counter += 1
+            if frame_counter % FRAME_STRIDE:
+                continue
+            ret, frame = cap.retrieve()
             if not ret:
                 print("Failed to read frame from camera.")
                 break
@@ -78,8 +184,7 @@ def main() -> None:
             result = vision.process_frame(frame)
 
             # Draw yellow line (horizontal)
-            line_y = int(-line_model.c / line_model.b)
-            cv2.line(frame, (0, line_y), (w, line_y), (0, 255, 255), 2)
+            cv2.line(frame, line_p1, line_p2, (0, 255, 255), 2)
 
             # Draw foot point if available
             if result.foot_point is not None:
@@ -90,19 +195,21 @@ def main() -> None:
             state_text = f"state: {result.line_state.value}"
             zone_text = f"zone: {result.line_zone.value}"
             safe_text = f"SAFE={result.is_safe}"
+            status_color = (0, 255, 0) if result.is_safe else (0, 0, 255)
             cv2.putText(frame, state_text, (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if result.is_safe else (0, 0, 255), 2)
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, status_color, 2)
             cv2.putText(frame, zone_text, (10, 60),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
             cv2.putText(frame, safe_text, (10, 90),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if result.is_safe else (0, 0, 255), 2)
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, status_color, 2)
 
             cv2.imshow("motion_line_record", frame)
 
             # Log only when state/zone/safety changes to keep CSV compact.
             current_state = (result.line_state.value, result.line_zone.value, result.is_safe)
             if current_state != prev_state:
-                timestamp = datetime.now().isoformat()
+                timestamp = iso_timestamp()
+                dist_r = round(result.dist, 2)
                 foot_x, foot_y = ("", "")
                 if result.foot_point is not None:
                     foot_x, foot_y = result.foot_point
@@ -112,28 +219,24 @@ def main() -> None:
                     result.line_zone.value,
                     result.is_safe,
                     result.has_motion,
-                    round(result.dist, 2),
+                    dist_r,
                     foot_x,
                     foot_y,
                 ]
-                try:
-                    writer.writerow(row)
-                    csv_file.flush()
-                    print(
-                        f"[LOG] t={timestamp} state={result.line_state.value} "
-                        f"zone={result.line_zone.value} SAFE={result.is_safe} "
-                        f"has_motion={result.has_motion} dist={round(result.dist, 2)} "
-                        f"foot=({foot_x},{foot_y})"
-                    )
-                except Exception as exc:
-                    print(f"[ERROR] Failed to write CSV row: {exc}")
+                log_writer.put(row)
+                print(
+                    f"[LOG] t={timestamp} state={result.line_state.value} "
+                    f"zone={result.line_zone.value} SAFE={result.is_safe} "
+                    f"has_motion={result.has_motion} dist={dist_r} "
+                    f"foot=({foot_x},{foot_y})"
+                )
                 prev_state = current_state
 
             key = cv2.waitKey(1) & 0xFF
             if key == ord("q"):
                 break
     finally:
-        csv_file.close()
+        log_writer.stop()  # also closes csv_file
         cap.release()
         cv2.destroyAllWindows()
 
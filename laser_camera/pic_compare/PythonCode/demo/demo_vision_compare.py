@@ -17,6 +17,7 @@ import cv2
 
 try:
     from core.image_comparator import ImageComparator
+    from core.camera_driver import open_usb_camera
 except ImportError as e:
     print("错误: 无法导入 core 模块。")
     print(f"当前 sys.path: {sys.path}")
@@ -24,10 +25,14 @@ except ImportError as e:
     raise e
 
 
+# 每 FRAME_STRIDE 帧只解码一帧 (30 FPS 摄像头 -> 15 FPS)，跳过的帧只 grab 不解码
+FRAME_STRIDE = 2
+
+
 def main() -> None:
     # 尝试打开摄像头 (索引 0 通常是内置，1 是外置)
     # 如果你用的是 USB 摄像头且没反应，尝试改成 1
-    cap = cv2.VideoCapture(0)
+    cap = open_usb_camera(0)
     
     if not cap.isOpened():
         print("Error: cannot open camera 0.")
@@ -40,8 +45,15 @@ def main() -> None:
 
     print("Starting Vision Motion Demo. Press 'q' or ESC to quit.")
 
+    frame_counter = 0
     while True:
-        ret, frame = cap.read()
+        if not cap.grab():
+            print("Error: failed to read frame from camera.")
+            break
+        frame_counter += 1
+        if frame_counter % FRAME_STRIDE:
+            continue
+        ret, frame = cap.retrieve()
         if not ret or frame is None:
             print("Error: failed to read frame from camera.")
             break
@@ -49,7 +61,8 @@ def main() -> None:
         # 核心算法处理
         result = comparator.compare(frame)
 
-        display = frame.copy()
+        # compare() keeps its own grayscale copy, so draw straight onto the frame
+        display = frame
 
         # 绘制差异框 (如果有)
         if "bboxes" in result:
@@ -17,13 +17,17 @@ Displays:
 
 from __future__ import annotations
 
+import io
+import queue
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import cv2
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # sys.path fix – MUST be before any "from core ..." imports
@@ -35,7 +39,7 @@ if str(project_root) not in sys.path:
 
 from core.camera_driver import CameraDriver
 from core.image_comparator import ImageComparator
-from core.vision_safety_logic import VisionSafetyLogic
+from core.vision_safety_logic import VisionSafetyLogic, bboxes_to_array
 from core import config
 
 
@@ -47,60 +51,181 @@ class VisionStatus:
     geom_distance_px: float
     num_boxes: int
     primary_bbox: Optional[Tuple[int, int, int, int]] = None
+    # all detections this frame, (N, 4) int32 x/y/w/h
+    boxes: np.ndarray = field(default_factory=lambda: np.empty((0, 4), np.int32))
 
 
-def _draw_overlay(
-    frame,
-    status: VisionStatus,
+class FrameGrabber:
+    """
+    Background camera reader.
+
+    Calls cam.get_frame() in a daemon thread and keeps only the newest frame
+    in a single-slot queue, so capture latency overlaps with detection/drawing
+    on the main thread and the consumer never sees a stale frame.
+    """
+
+    def __init__(self, cam: CameraDriver) -> None:
+        self.cam = cam
+        self.q: "queue.Queue" = queue.Queue(maxsize=1)
+        self.stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self._thread.join(timeout=1.0)
+
+    def _loop(self) -> None:
+        while not self.stop_event.is_set():
+            frame = self.cam.get_frame()
+            if frame is None:
+                time.sleep(0.05)
+                continue
+            try:
+                self.q.put_nowait(frame)
+            except queue.Full:
+                # drop the older, unconsumed frame
+                try:
+                    self.q.get_nowait()
+                except queue.Empty:
+                    pass
+                self.q.put_nowait(frame)
+
+
+# motion detection runs on a PROC_W-wide proxy; bboxes come back in full-frame pixels
+PROC_W = 480
+
+# consecutive frames without boxes before the status falls back to SAFE
+EMPTY_FRAMES_TO_SAFE = 3
+
+# every frame is evaluated, every DISPLAY_STRIDE-th one is drawn / shown / polled for keys
+DISPLAY_STRIDE = 2
+
+HUD_BAR_H = 40
+
+_LEVEL_COLORS = {
+    "DANGER": (0, 0, 255),
+    "CAUTION": (0, 255, 255),
+}
+_DEFAULT_COLOR = (0, 200, 0)
+
+# filled HUD bar backgrounds keyed by (width, level); the text changes every
+# frame (d / motion), so only the background is cached and the text is drawn on top
+_hud_cache: Dict[Tuple[int, str], np.ndarray] = {}
+
+
+# Per-frame log lines are buffered and written to stdout about once per second
+LOG_FLUSH_INTERVAL_S = 1.0
+_LOG_BUF = io.StringIO()
+_LAST_FLUSH = [time.monotonic()]
+
+
+def _log_flush() -> None:
+    sys.stdout.write(_LOG_BUF.getvalue())
+    sys.stdout.flush()
+    _LOG_BUF.seek(0)
+    _LOG_BUF.truncate()
+    _LAST_FLUSH[0] = time.monotonic()
+
+
+def _log(line: str) -> None:
+    """Buffered replacement for a per-frame print()."""
+    _LOG_BUF.write(line)
+    _LOG_BUF.write("\n")
+    if time.monotonic() - _LAST_FLUSH[0] > LOG_FLUSH_INTERVAL_S:
+        _log_flush()
+
+
+def _parse(result: dict) -> Tuple[List[Tuple[int, int, int, int]], float]:
+    """
+    Unpack ImageComparator.compare() output: (bboxes, motion_score).
+
+    compare() always returns a dict; any other shape is a bug at the
+    comparator boundary, so only a malformed score is tolerated here.
+    """
+    bboxes = result["bboxes"] or []
+    try:
+        motion_score = float(result.get("motion_score", 0.0) or 0.0)
+    except (TypeError, ValueError):
+        motion_score = 0.0
+    return bboxes, motion_score
+
+
+def build_static_overlay(
+    fw: int,
+    fh: int,
     line_p1: Tuple[float, float],
     line_p2: Tuple[float, float],
-) -> None:
-    """Draw yellow line, primary bbox, and HUD text."""
-    h, w = frame.shape[:2]
-
-    # Draw yellow line (can be slanted)
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rasterize the yellow line (static for the whole run) once.
+    Returns (overlay, mask) for cv2.copyTo(overlay, mask, frame).
+    """
+    overlay = np.zeros((fh, fw, 3), np.uint8)
     cv2.line(
-        frame,
+        overlay,
         (int(line_p1[0]), int(line_p1[1])),
         (int(line_p2[0]), int(line_p2[1])),
         (0, 255, 255),
         2,
     )
+    mask = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
+    return overlay, mask
+
+
+def _hud_bar(width: int, level: str) -> np.ndarray:
+    """Level-coloured HUD bar background; one per (width, level)."""
+    key = (width, level)
+    bar = _hud_cache.get(key)
+    if bar is None:
+        bar = np.empty((HUD_BAR_H, width, 3), np.uint8)
+        bar[:] = _LEVEL_COLORS.get(level, _DEFAULT_COLOR)
+        _hud_cache[key] = bar
+    return bar
+
+
+def _draw_overlay(
+    frame,
+    status: VisionStatus,
+    static_overlay: np.ndarray,
+    static_mask: np.ndarray,
+) -> None:
+    """Draw yellow line, primary bbox, and HUD text."""
+    h, w = frame.shape[:2]
+
+    # Yellow line (can be slanted), pre-rendered
+    cv2.copyTo(static_overlay, static_mask, frame)
+
+    # colour depends only on the level, pick it once for every box
+    color = _LEVEL_COLORS.get(status.level, _DEFAULT_COLOR)
+
+    # All detections (thin), one tolist() instead of per-box numpy scalars
+    for x, y, bw, bh in status.boxes.tolist():
+        cv2.rectangle(frame, (x, y), (x + bw, y + bh), color, 1)
 
     # Draw primary bbox if present
     if status.primary_bbox is not None:
         x, y, bw, bh = status.primary_bbox
-        if status.level == "DANGER":
-            color = (0, 0, 255)
-        elif status.level == "CAUTION":
-            color = (0, 255, 255)
-        else:
-            color = (0, 200, 0)
         cv2.rectangle(frame, (x, y), (x + bw, y + bh), color, 2)
         fx = int(x + bw / 2)
         fy = int(y + bh)
         cv2.circle(frame, (fx, fy), 6, (0, 0, 255), -1)
 
     # HUD bar
-    bar_h = 40
-    if status.level == "DANGER":
-        bar_color = (0, 0, 255)
-    elif status.level == "CAUTION":
-        bar_color = (0, 255, 255)
-    else:
-        bar_color = (0, 200, 0)
-
-    cv2.rectangle(frame, (0, 0), (w, bar_h), bar_color, thickness=-1)
     text = (
         f"LEVEL={status.level} ZONE={status.zone} "
         f"d={status.geom_distance_px:.2f}px "
         f"motion={status.motion_score:.4f} "
         f"boxes={status.num_boxes}"
     )
+    bar_h = min(HUD_BAR_H, h)
+    frame[:bar_h] = _hud_bar(w, status.level)[:bar_h]
     cv2.putText(
         frame,
         text,
-        (10, int(bar_h * 0.7)),
+        (10, int(HUD_BAR_H * 0.7)),
         cv2.FONT_HERSHEY_SIMPLEX,
         0.7,
         (0, 0, 0),
@@ -118,7 +243,7 @@ def main() -> None:
         print("[VISION_RT] ERROR: cannot open camera.")
         return
 
-    comparator = ImageComparator(mode="frame_diff")
+    comparator = ImageComparator(mode="frame_diff", proc_width=PROC_W, skip_static=True)
 
     # Read one frame to get dimensions
     ok, first_frame = cam.read()
@@ -129,14 +254,22 @@ def main() -> None:
     fh, fw = first_frame.shape[:2]
 
     safety_logic = VisionSafetyLogic(frame_width=fw, frame_height=fh)
+    static_overlay, static_mask = build_static_overlay(
+        fw, fh, safety_logic.line_p1, safety_logic.line_p2
+    )
+
+    grabber = FrameGrabber(cam)
+    grabber.start()
 
     frame_counter = 0
+    empty_frames = 0
+    status: Optional[VisionStatus] = None
     try:
         while True:
-            ok, frame = cam.read()
-            if not ok or frame is None:
+            try:
+                frame = grabber.q.get(timeout=1.0)
+            except queue.Empty:
                 print("[VISION_RT] WARNING: failed to read frame.")
-                time.sleep(0.05)
                 continue
 
             frame_counter += 1
@@ -144,59 +277,54 @@ def main() -> None:
             # Motion detection
             result = comparator.compare(frame)
 
-            # Robust parsing of comparator output (aligned with motion demo)
-            bboxes: List[Tuple[int, int, int, int]] = []
-            motion_score: float = 0.0
-            if isinstance(result, (tuple, list)):
-                if len(result) == 3:
-                    bboxes, motion_score, _ = result
-                elif len(result) == 2:
-                    bboxes, motion_score = result
-                elif len(result) == 1:
-                    bboxes = result[0]
-                else:
-                    bboxes = result[0]
-                    motion_score = result[1]
-            elif isinstance(result, dict):
-                bboxes = result.get("bboxes", []) or []
-                motion_raw = result.get("motion_score", 0.0)
-                try:
-                    motion_score = float(motion_raw)
-                except (TypeError, ValueError):
-                    motion_score = 0.0
-            elif result is None:
-                bboxes = []
-                motion_score = 0.0
+            bboxes, motion_score = _parse(result)
+
+            if bboxes:
+                empty_frames = 0
+                boxes = bboxes_to_array(bboxes)
+                # Safety evaluation (distance-based)
+                level, zone, d_px, primary_bbox = safety_logic.evaluate_distance(boxes, motion_score)
+                status = VisionStatus(
+                    level=level.name,
+                    zone=zone.name,
+                    motion_score=motion_score,
+                    geom_distance_px=d_px,
+                    num_boxes=len(boxes),
+                    primary_bbox=primary_bbox,
+                    boxes=boxes,
+                )
             else:
-                bboxes = result  # type: ignore[assignment]
-
-            # Safety evaluation (distance-based)
-            level, zone, d_px, primary_bbox = safety_logic.evaluate_distance(bboxes, motion_score)
-
-            status = VisionStatus(
-                level=level.name if hasattr(level, "name") else str(level),
-                zone=zone.name if hasattr(zone, "name") else str(zone),
-                motion_score=motion_score,
-                geom_distance_px=d_px,
-                num_boxes=len(bboxes),
-                primary_bbox=primary_bbox,
-            )
-
-            # HUD overlay and drawing
-            _draw_overlay(frame, status, safety_logic.line_p1, safety_logic.line_p2)
+                # Idle frame: no safety evaluation. Hold the last result for a
+                # few frames (a target can drop out for a frame), then SAFE.
+                empty_frames += 1
+                if status is None or empty_frames >= EMPTY_FRAMES_TO_SAFE:
+                    status = VisionStatus(
+                        level="SAFE",
+                        zone="OUTSIDE_SAFE",
+                        motion_score=motion_score,
+                        geom_distance_px=0.0,
+                        num_boxes=0,
+                    )
 
             # Log
-            print(
+            _log(
                 f"[VISION_RT] frame={frame_counter:04d} "
                 f"level={status.level} zone={status.zone} "
                 f"d={status.geom_distance_px:.1f}px bbox={status.primary_bbox}"
             )
 
+            if frame_counter % DISPLAY_STRIDE:
+                continue
+
+            # HUD overlay and drawing
+            _draw_overlay(frame, status, static_overlay, static_mask)
             cv2.imshow("Vision Safety (Realtime)", frame)
             key = cv2.waitKey(1) & 0xFF
             if key == ord("q"):
                 break
     finally:
+        _log_flush()
+        grabber.stop()
         cam.close()
         cv2.destroyAllWindows()
         print("=== demo_vision_realtime.py finished ===")
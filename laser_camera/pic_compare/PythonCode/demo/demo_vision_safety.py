@@ -4,17 +4,15 @@ import sys
 import cv2
 from pathlib import Path
 
+# Ensure project root (PythonCode) is on sys.path
 current_file = Path(__file__).resolve()
 project_root = current_file.parent.parent  # 向上两级找到 PythonCode
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
-    
-# Ensure project root (PythonCode) is on sys.path
-from core.image_comparator import ImageComparator
-from core.vision_safety_logic import VisionSafetyLogic, SafetyLevel
 
 try:
     from core.image_comparator import ImageComparator
+    from core.camera_driver import open_usb_camera
     from core.vision_safety_logic import VisionSafetyLogic, SafetyLevel
 except ImportError as e:
     print("错误: 无法导入 core 模块。")
@@ -22,25 +20,45 @@ except ImportError as e:
     print(f"尝试加载的项目根目录: {project_root}")
     raise e
 
-# Ensure project root (PythonCode) is on sys.path
-ROOT_DIR = Path(__file__).resolve().parent.parent
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+
+# Decode only every FRAME_STRIDE-th camera frame (30 FPS camera -> 15 FPS)
+FRAME_STRIDE = 2
+
+# motion detection runs on a PROC_W-wide proxy; bboxes come back in full-frame pixels
+PROC_W = 480
+
+# drawing constants
+COLOR_BOX = (0, 255, 0)
+COLOR_TARGET = (0, 255, 255)
+BAR_H = 40
+# level -> (status text, bar color)
+_LEVEL_STYLE = {
+    SafetyLevel.SAFE: ("SAFE", (0, 255, 0)),
+    SafetyLevel.CAUTION: ("CAUTION", (0, 255, 255)),
+    SafetyLevel.DANGER: ("DANGER", (0, 0, 255)),
+}
 
 
 def main() -> None:
-    cap = cv2.VideoCapture(0)
+    cap = open_usb_camera(0)
     if not cap.isOpened():
         print("Error: cannot open camera 0.")
         return
 
-    comparator = ImageComparator(mode="frame_diff", diff_threshold=0.02)
+    comparator = ImageComparator(mode="frame_diff", diff_threshold=0.02, proc_width=PROC_W)
     safety_logic = VisionSafetyLogic(line_band_top_ratio=0.6, line_band_bottom_ratio=0.8)
 
     print("Starting Vision Safety Demo. Press 'q' or ESC to quit.")
 
+    frame_counter = 0
     while True:
-        ret, frame = cap.read()
+        if not cap.grab():
+            print("Error: failed to read frame from camera.")
+            break
+        frame_counter += 1
+        if frame_counter % FRAME_STRIDE:
+            continue
+        ret, frame = cap.retrieve()
         if not ret or frame is None:
             print("Error: failed to read frame from camera.")
             break
@@ -49,33 +67,25 @@ def main() -> None:
         bboxes = result.get("bboxes", [])
         safety = safety_logic.evaluate(frame.shape, bboxes)
 
-        display = frame.copy()
+        # compare() keeps its own grayscale copy, so draw straight onto the frame
+        display = frame
 
         # Draw all detected bounding boxes
         for (x, y, w, h) in bboxes:
-            cv2.rectangle(display, (x, y), (x + w, y + h), (0, 255, 0), 2)
+            cv2.rectangle(display, (x, y), (x + w, y + h), COLOR_BOX, 2)
 
         # Highlight the chosen bbox, if any
         if safety.bbox is not None:
             x, y, w, h = safety.bbox
-            cv2.rectangle(display, (x, y), (x + w, y + h), (0, 255, 255), 3)
+            cv2.rectangle(display, (x, y), (x + w, y + h), COLOR_TARGET, 3)
 
         # Determine status text and color
-        if safety.level == SafetyLevel.SAFE:
-            status_text = "SAFE"
-            color = (0, 255, 0)
-        elif safety.level == SafetyLevel.CAUTION:
-            status_text = "CAUTION"
-            color = (0, 255, 255)
-        else:
-            status_text = "DANGER"
-            color = (0, 0, 255)
+        status_text, color = _LEVEL_STYLE[safety.level]
 
         motion_score = result.get("motion_score", 0.0)
 
         # Draw status bar
-        bar_height = 40
-        cv2.rectangle(display, (0, 0), (display.shape[1], bar_height), color, thickness=-1)
+        cv2.rectangle(display, (0, 0), (display.shape[1], BAR_H), color, thickness=-1)
         cv2.putText(
             display,
             f"{status_text} | score={motion_score:.4f}",
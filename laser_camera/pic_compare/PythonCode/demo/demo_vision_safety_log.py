@@ -1,56 +1,72 @@
 from __future__ import annotations
 
 import csv
+import os
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
 
-import cv2
-
-current_file = Path(__file__).resolve()
-project_root = current_file.parent.parent  # 向上两级找到 PythonCode
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# Ensure project root (PythonCode) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent  # 向上两级找到 PythonCode
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
 try:
     from core.image_comparator import ImageComparator
+    from core.camera_driver import open_usb_camera
     from core.vision_safety_logic import VisionSafetyLogic
 except ImportError as e:
     print("错误: 无法导入 core 模块。")
     print(f"当前 sys.path: {sys.path}")
-    print(f"尝试加载的项目根目录: {project_root}")
+    print(f"尝试加载的项目根目录: {ROOT_DIR}")
     raise e
 
 
+# motion detection runs on a PROC_W-wide proxy; bboxes come back in full-frame pixels
+PROC_W = 480
 
-# Ensure project root (PythonCode) is on sys.path
-ROOT_DIR = Path(__file__).resolve().parent.parent
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+# CSV rows are written in batches of CSV_BATCH rows, and flushed at most
+# every CSV_FLUSH_INTERVAL_S; fsync only once on exit
+CSV_BATCH = 50
+CSV_FLUSH_INTERVAL_S = 1.0
+
+# one evaluated + logged frame per LOG_PERIOD_S; frames in between are
+# grab()-ed (kept fresh in the driver, never decoded)
+LOG_PERIOD_S = 0.1
 
 
 def main() -> None:
-    cap = cv2.VideoCapture(0)
+    cap = open_usb_camera(0)
     if not cap.isOpened():
         print("Error: cannot open camera 0.")
         return
 
-    comparator = ImageComparator(mode="frame_diff", diff_threshold=0.02)
+    comparator = ImageComparator(mode="frame_diff", diff_threshold=0.02, proc_width=PROC_W)
     safety_logic = VisionSafetyLogic(line_band_top_ratio=0.6, line_band_bottom_ratio=0.8)
 
     data_dir = ROOT_DIR / "data"
     data_dir.mkdir(exist_ok=True)
     log_path = data_dir / "vision_log.csv"
 
-    with log_path.open("a", newline="", encoding="utf-8") as csvfile:
+    with log_path.open("a", newline="", encoding="utf-8", buffering=65536) as csvfile:
         writer = csv.writer(csvfile)
         # Write header if file is empty
         if log_path.stat().st_size == 0:
             writer.writerow(["timestamp_iso", "safety_level", "zone", "motion_score", "num_boxes"])
 
+        rows: list[list] = []
+        last_flush = time.monotonic()
+        next_tick = last_flush
         try:
             while True:
-                ret, frame = cap.read()
+                if not cap.grab():
+                    print("Error: failed to read frame from camera.")
+                    break
+                now = time.monotonic()
+                if now < next_tick:
+                    continue
+                next_tick = now + LOG_PERIOD_S
+                ret, frame = cap.retrieve()
                 if not ret or frame is None:
                     print("Error: failed to read frame from camera.")
                     break
@@ -62,25 +78,33 @@ def main() -> None:
 
                 safety = safety_logic.evaluate(frame.shape, bboxes)
 
-                timestamp = datetime.now().isoformat()
-                writer.writerow([
+                timestamp = datetime.now().isoformat(timespec="milliseconds")
+                rows.append([
                     timestamp,
                     safety.level.name,
                     safety.zone.name,
                     f"{motion_score:.4f}",
                     num_boxes,
                 ])
-                csvfile.flush()
+                if len(rows) >= CSV_BATCH:
+                    writer.writerows(rows)
+                    rows.clear()
+                if now - last_flush > CSV_FLUSH_INTERVAL_S:
+                    writer.writerows(rows)
+                    rows.clear()
+                    csvfile.flush()
+                    last_flush = now
 
                 print(
                     f"[VISION_LOG] t={timestamp} level={safety.level.name} "
                     f"zone={safety.zone.name} score={motion_score:.4f} boxes={num_boxes}"
                 )
-
-                time.sleep(0.1)  # avoid flooding the console
         except KeyboardInterrupt:
             print("\nInterrupted by user, exiting.")
         finally:
+            writer.writerows(rows)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
             cap.release()
 
 
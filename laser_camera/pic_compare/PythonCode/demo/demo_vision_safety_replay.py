@@ -4,35 +4,71 @@ import csv
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Ensure project root is importable
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from core.yellow_line_logic import ZONE_INDEX
 from core.yellow_line_tracker import LineZone
-from core.vision_safety_controller import evaluate_vision_safety
+from core.vision_safety_controller import evaluate_vision_safety_batch
+
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes"})
+# plain dict lookup instead of Enum.__getitem__ per row
+_ZONE_BY_NAME = {zone.name: zone for zone in LineZone}
 
 
 def replay_vision_safety(csv_path: Path) -> None:
     with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Column indices resolved once; support both "zone" and "line_zone" headers.
+        zone_i = header.index("zone" if "zone" in header else "line_zone")
+        dist_i = header.index("dist")
+        motion_i = header.index("has_motion")
+        ts_i = header.index("timestamp") if "timestamp" in header else -1
+
+        # Parse every row first, then evaluate the whole log in one batch.
+        timestamps: list[str] = []
+        zones: list[LineZone] = []
+        dists: list[float] = []
+        motions: list[bool] = []
         for row in reader:
             try:
-                # Support both "zone" and "line_zone" headers.
-                zone_key = "zone" if "zone" in row else "line_zone"
-                zone = LineZone[row[zone_key]]
-                dist = float(row["dist"])
-                has_motion = row["has_motion"].lower() in ("1", "true", "yes")
-                decision = evaluate_vision_safety(zone, dist, has_motion)
-                timestamp = row.get("timestamp", "")
-                print(
-                    f"[REPLAY] t={timestamp} zone={zone.name} dist={dist:.2f} "
-                    f"motion={has_motion} -> level={decision.level.name}, "
-                    f"output_enabled={decision.output_enabled}, "
-                    f"is_safe={decision.is_safe}, reason={decision.reason}"
-                )
+                zone = _ZONE_BY_NAME[row[zone_i]]
+                dist = float(row[dist_i])
+                has_motion = row[motion_i].lower() in _TRUE_STRINGS
             except Exception as exc:
                 print(f"[ERROR] Failed to process row {row}: {exc}")
+                continue
+            timestamps.append(row[ts_i] if ts_i >= 0 else "")
+            zones.append(zone)
+            dists.append(dist)
+            motions.append(has_motion)
+
+    decisions = evaluate_vision_safety_batch(
+        np.array([ZONE_INDEX[z] for z in zones], dtype=np.int8),
+        np.array(dists, dtype=np.float64),
+        np.array(motions, dtype=bool),
+    )
+    if not decisions:
+        return
+    # One stdout write for the whole replay instead of a print() per row.
+    lines = [
+        f"[REPLAY] t={timestamp} zone={zone.name} dist={dist:.2f} "
+        f"motion={has_motion} -> level={decision.level.name}, "
+        f"output_enabled={decision.output_enabled}, "
+        f"is_safe={decision.is_safe}, reason={decision.reason}"
+        for timestamp, zone, dist, has_motion, decision in zip(
+            timestamps, zones, dists, motions, decisions
+        )
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -17,10 +17,21 @@ from __future__ import annotations
 import math
 import sys
 from pathlib import Path
-import time
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 import cv2
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba 可选：没有时下面的 kernel 按普通 Python 运行
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if args and callable(args[0]):  # bare @njit
+            return args[0]
+
+        def _wrap(fn):
+            return fn
+        return _wrap
 
 # ---------------------------------------------------------------------------
 # sys.path 修复 —— 一定要在 from core ... 之前
@@ -33,87 +44,92 @@ if str(project_root) not in sys.path:
 from core import config  # noqa: E402
 from core.camera_driver import CameraDriver  # noqa: E402
 from core.image_comparator import ImageComparator  # noqa: E402
+from core.text_cache import put_text_cached  # noqa: E402
+from core.line_overlay import build_static_overlay  # noqa: E402
 from core.distance_compare_geometry import build_line_points_from_config  # noqa: E402
-from core.lidar_bridge import read_lidar_once, LidarSnapshot  # noqa: E402
+from core.lidar_bridge import LidarPoller, LidarSnapshot  # noqa: E402
 from core.vision_lidar_fusion import fuse_vision_and_lidar, FusionLevel  # noqa: E402
-from core.vision_safety_logic import SafetyLevel, SafetyZone, VisionSafetyResult  # noqa: E402
+from core.vision_safety_logic import (  # noqa: E402
+    SafetyLevel,
+    SafetyZone,
+    VisionSafetyResult,
+    bboxes_to_array,
+)
 
 
-# ---------------------------------------------------------------------------
-# 几何工具（和 static_demo 保持同一套约定）
-# ---------------------------------------------------------------------------
+# 终端日志：每帧一行，攒够 LOG_BATCH_FRAMES 行后一次性写出
+LOG_BATCH_FRAMES = 10
 
-def signed_distance_to_line(px: Tuple[float, float],
-                            p1: Tuple[float, float],
-                            p2: Tuple[float, float]) -> float:
-    """
-    计算点 P 到有向直线 P1->P2 的带符号距离。
+# 融合等级 -> HUD 颜色 (BGR)
+_HUD_COLORS = {
+    FusionLevel.DANGER: (0, 0, 255),
+    FusionLevel.CAUTION: (0, 255, 255),
+    FusionLevel.SAFE: (0, 255, 0),
+}
+_HUD_COLOR_DEFAULT = (200, 200, 200)
 
-    约定：
-    - 线的“右侧”（走廊侧）为 SAFE，d > 0
-    - 线的“左侧”（机柜侧）为 DANGER，d < 0
-    """
-    x0, y0 = px
-    x1, y1 = p1
-    x2, y2 = p2
-
-    dx = x2 - x1
-    dy = y2 - y1
-    if dx == 0 and dy == 0:
-        return 0.0
-
-    # (dx, dy) 的左法向量 (-dy, dx)
-    nx = -dy
-    ny = dx
-    norm = math.hypot(nx, ny)
-    if norm == 0:
-        return 0.0
-
-    nx /= norm
-    ny /= norm
 
-    vx = x0 - x1
-    vy = y0 - y1
+# ---------------------------------------------------------------------------
+# 几何工具（和 static_demo 保持同一套约定）
+# ---------------------------------------------------------------------------
 
-    d = vx * nx + vy * ny
-    return d
+# _compute_zone_nb 返回的区域序号 -> 区域名
+_ZONE_NAMES = ("ON_LINE", "INSIDE_DANGER", "OUTSIDE_SAFE", "NEAR_LINE")
+# 与 _ZONE_NAMES 同序：主 bbox 颜色 (BGR)，以及映射到视觉安全层的 (level, zone)
+_ZONE_BBOX_COLORS = ((0, 255, 255), (0, 0, 255), (0, 255, 0), (0, 255, 255))
+_ZONE_VISION = (
+    (SafetyLevel.CAUTION, SafetyZone.ON_LINE),
+    (SafetyLevel.DANGER, SafetyZone.INSIDE_DANGER),
+    (SafetyLevel.SAFE, SafetyZone.OUTSIDE_SAFE),
+    (SafetyLevel.SAFE, SafetyZone.OUTSIDE_SAFE),
+)
 
 
-def classify_distance_zone(d: float, cfg) -> str:
-    """
-    使用 config.DISTANCE_COMPARE 中的阈值进行区域判别。
+@njit(fastmath=True)
+def _compute_zone_nb(fx, fy, p1x, p1y, nx, ny, tol, danger_thr, safe_thr):
     """
-    tol = cfg.on_line_tolerance_px
-    danger_thr = cfg.danger_inside_threshold_px
-    safe_thr = cfg.safe_far_threshold_px
-
-    if abs(d) <= tol:
-        return "ON_LINE"
-    if d < -danger_thr:
-        return "INSIDE_DANGER"
-    if d > safe_thr:
-        return "OUTSIDE_SAFE"
-    return "NEAR_LINE"
+    脚底点 -> (带符号距离, 区域序号)，距离 + 区域判别合成一个 nopython 函数。
+    (nx, ny) 为 line_normal() 的单位左法向量：线的“右侧”（走廊侧）d > 0 为 SAFE，
+    “左侧”（机柜侧）d < 0 为 DANGER。阈值取自 config.DISTANCE_COMPARE。
 
-
-def foot_from_bbox(bbox: Tuple[int, int, int, int]) -> Tuple[float, float]:
-    """
-    根据 bbox (x, y, w, h) 粗略估计“脚底点”：取 bbox 底边中点。
+    按出现频率排序（远离黄线最常见）；要求 tol <= danger_thr 且
+    tol <= safe_thr（配置默认 20 / 80 / 130），此时与先判 ON_LINE 的顺序等价。
     """
-    x, y, w, h = bbox
-    fx = x + w / 2.0
-    fy = y + h
-    return fx, fy
+    d = (fx - p1x) * nx + (fy - p1y) * ny
+    if d > safe_thr:
+        return d, 2
+    if d < -danger_thr:
+        return d, 1
+    if -tol <= d <= tol:
+        return d, 0
+    return d, 3
 
 
-def pick_main_bbox(bboxes: List[Tuple[int, int, int, int]]) -> Tuple[int, int, int, int] | None:
+def pick_main_bbox(boxes: np.ndarray) -> int | None:
     """
-    从多个 bbox 中挑一个“主目标”：
+    从 (N, 4) 的 x, y, w, h 数组中挑一个“主目标”，返回其行号：
     简单策略：y+h 最大（画面最低的那个），通常是离摄像头最近的人。
     """
-    if not bboxes:
+    if len(boxes) == 0:
         return None
-    return max(bboxes, key=lambda b: b[1] + b[3])
+    return int(np.argmax(boxes[:, 1] + boxes[:, 3]))
+
+
+class LineNormal(NamedTuple):
+    """有向直线 P1->P2 的单位左法向量 (nx, ny)；黄线固定，整个会话只算一次。"""
+    nx: float
+    ny: float
+
+
+def line_normal(p1: Tuple[float, float], p2: Tuple[float, float]) -> LineNormal:
+    """P1 == P2 时返回 (0, 0)，距离恒为 0。"""
+    dx = p2[0] - p1[0]
+    dy = p2[1] - p1[1]
+    norm = math.hypot(dx, dy)
+    if norm == 0:
+        return LineNormal(0.0, 0.0)
+    inv = 1.0 / norm
+    return LineNormal(-dy * inv, dx * inv)
 
 
 # ---------------------------------------------------------------------------
@@ -148,16 +164,27 @@ def main() -> None:
 
     h, w = frame.shape[:2]
     p1, p2 = build_line_points_from_config(w, h, dist_cfg)
+    normal = line_normal(p1, p2)
+    static_overlay, static_mask, static_roi = build_static_overlay(w, h, p1, p2)
+    zone_args = (
+        float(p1[0]), float(p1[1]), normal.nx, normal.ny,
+        float(dist_cfg.on_line_tolerance_px),
+        float(dist_cfg.danger_inside_threshold_px),
+        float(dist_cfg.safe_far_threshold_px),
+    )
+    # 先调用一次，把 JIT 编译放在进入主循环之前
+    _compute_zone_nb(0.0, 0.0, *zone_args)
     print(f"[INFO] frame size = {w}x{h}")
     print(f"[INFO] yellow line p1={p1}, p2={p2}")
 
     cv2.namedWindow("distance_compare_motion_demo", cv2.WINDOW_NORMAL)
 
-    last_lidar_ts: float = 0.0
-    last_lidar: LidarSnapshot | None = None
-    LIDAR_INTERVAL_SEC: float = 0.2  # 每 0.2 秒采一次雷达
+    LIDAR_INTERVAL_SEC: float = 0.2  # 每 0.2 秒采一次雷达（后台线程，不阻塞取帧）
+    lidar_poller = LidarPoller(LIDAR_INTERVAL_SEC)
+    lidar_poller.start()
 
     frame_id = 0
+    log_lines: List[str] = []
     try:
         while True:
             ok, frame = camera.read()
@@ -170,47 +197,20 @@ def main() -> None:
             # --- 1) 运动检测，拿到 bbox 列表 & motion_score ---
             result = comparator.compare(frame)
 
-            # 默认值，防止后面使用时未定义
-            bboxes: List[Tuple[int, int, int, int]] = []
-            motion_score: float = 0.0
-
-            # 常见情况：compare 返回 3 元组或 2 元组
-            if isinstance(result, (tuple, list)):
-                if len(result) == 3:
-                    # e.g. (bboxes, motion_score, debug_frame)
-                    bboxes, motion_score, _ = result
-                elif len(result) == 2:
-                    # e.g. (bboxes, motion_score)
-                    bboxes, motion_score = result
-                elif len(result) == 1:
-                    # e.g. (bboxes,)
-                    bboxes = result[0]
-                else:
-                    # 长度大于 3 时，只用前两个元素
-                    bboxes = result[0]
-                    motion_score = result[1]
-            # 另一种实现风格：compare 返回 dict
-            elif isinstance(result, dict):
-                bboxes = result.get("bboxes", []) or []
-                motion_raw = result.get("motion_score", 0.0)
-                try:
-                    motion_score = float(motion_raw)
-                except (TypeError, ValueError):
-                    motion_score = 0.0
-            # compare 返回 None：直接认为当前无目标
-            elif result is None:
-                bboxes = []
+            # ImageComparator.compare() 固定返回 dict（见 core.image_comparator）
+            # 在边界处一次性打包成 (N, 4) int32 数组，后续只做数组运算
+            boxes = bboxes_to_array(result["bboxes"] or [])
+            try:
+                motion_score = float(result.get("motion_score", 0.0) or 0.0)
+            except (TypeError, ValueError):
                 motion_score = 0.0
-            else:
-                # 最兜底：假设 result 本身就是 bbox 列表
-                bboxes = result  # type: ignore[assignment]
 
             # --- 2) 从 bbox 中挑选主目标并计算脚底点 & 区域 ---
             zone_text = "NO_TARGET"
             dist_text = ""
-            hud_color = (200, 200, 200)
-            bbox_color = (200, 200, 200)
-            vis = frame.copy()
+            # compare() keeps its own grayscale copy and frame isn't used
+            # afterwards, so draw straight onto it (no per-frame HxWx3 copy)
+            vis = frame
             d_value: float | None = None
             vision_result = VisionSafetyResult(
                 level=SafetyLevel.SAFE,
@@ -220,47 +220,24 @@ def main() -> None:
                 primary_bbox=None,
             )
 
-            # 画黄线
-            cv2.line(
-                vis,
-                (int(p1[0]), int(p1[1])),
-                (int(p2[0]), int(p2[1])),
-                (0, 255, 255),
-                3,
-            )
-            cv2.putText(
-                vis,
-                "YELLOW LINE",
-                (int(p1[0]) + 10, int(p1[1]) - 10),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.8,
-                (0, 255, 255),
-                2,
-            )
+            # 画黄线（预先栅格化的静态层）
+            cv2.copyTo(static_overlay, static_mask, vis[static_roi])
 
-            if bboxes:
-                main_bbox = pick_main_bbox(bboxes)
+            main_i = pick_main_bbox(boxes)
+            if main_i is not None:
+                # 主目标 = 脚底最低 (y+h 最大)
+                main_bbox = tuple(boxes[main_i].tolist())
                 x, y, bw, bh = main_bbox
+                fx, fy = x + bw / 2.0, float(y + bh)
 
-                # 估计脚底点
-                fx, fy = foot_from_bbox(main_bbox)
-
-                # 计算距离 & 区域
-                d = signed_distance_to_line((fx, fy), p1, p2)
-                zone = classify_distance_zone(d, dist_cfg)
-                zone_text = zone
+                # 计算距离 & 区域（一次 JIT 调用）
+                d, zone_idx = _compute_zone_nb(fx, fy, *zone_args)
+                zone_text = _ZONE_NAMES[zone_idx]
                 dist_text = f"d = {d:.2f}px"
                 d_value = d
 
-                if zone_text == "OUTSIDE_SAFE":
-                    bbox_color = (0, 255, 0)
-                elif zone_text in ("ON_LINE", "NEAR_LINE"):
-                    bbox_color = (0, 255, 255)
-                elif zone_text == "INSIDE_DANGER":
-                    bbox_color = (0, 0, 255)
-
-                # 画出主 bbox（用 hud_color）
-                cv2.rectangle(vis, (x, y), (x + bw, y + bh), bbox_color, 2)
+                # 画出主 bbox（按区域着色）
+                cv2.rectangle(vis, (x, y), (x + bw, y + bh), _ZONE_BBOX_COLORS[zone_idx], 2)
 
                 # 脚底点
                 cv2.circle(vis, (int(fx), int(fy)), 8, (0, 0, 255), -1)
@@ -274,20 +251,7 @@ def main() -> None:
                     2,
                 )
 
-                vision_level = (
-                    SafetyLevel.SAFE
-                    if zone_text in ("OUTSIDE_SAFE", "NEAR_LINE")
-                    else SafetyLevel.CAUTION
-                    if zone_text == "ON_LINE"
-                    else SafetyLevel.DANGER
-                )
-                vision_zone = (
-                    SafetyZone.OUTSIDE_SAFE
-                    if zone_text in ("OUTSIDE_SAFE", "NEAR_LINE")
-                    else SafetyZone.ON_LINE
-                    if zone_text == "ON_LINE"
-                    else SafetyZone.INSIDE_DANGER
-                )
+                vision_level, vision_zone = _ZONE_VISION[zone_idx]
                 vision_result = VisionSafetyResult(
                     level=vision_level,
                     zone=vision_zone,
@@ -296,10 +260,7 @@ def main() -> None:
                     primary_bbox=main_bbox,
                 )
 
-            now = time.time()
-            if now - last_lidar_ts > LIDAR_INTERVAL_SEC:
-                last_lidar = read_lidar_once()
-                last_lidar_ts = now
+            last_lidar: LidarSnapshot | None = lidar_poller.latest
 
             lidar_value = (
                 last_lidar.distance_cm
@@ -308,46 +269,37 @@ def main() -> None:
             )
             fusion = fuse_vision_and_lidar(vision_result, lidar_value)
 
-            if fusion.level == FusionLevel.DANGER:
-                hud_color = (0, 0, 255)
-            elif fusion.level == FusionLevel.CAUTION:
-                hud_color = (0, 255, 255)
-            elif fusion.level == FusionLevel.SAFE:
-                hud_color = (0, 255, 0)
-            else:
-                hud_color = (200, 200, 200)
+            level = fusion.level
+            hud_color = _HUD_COLORS.get(level, _HUD_COLOR_DEFAULT)
 
             if lidar_value is not None:
-                lidar_log = f"lidar_cm={lidar_value:.1f}"
-                lidar_hud = f"lidar={lidar_value:.1f}cm"
+                lidar_s = f"{lidar_value:.1f}"
+                lidar_log = "lidar_cm=" + lidar_s
+                lidar_hud = "lidar=" + lidar_s + "cm"
             else:
                 lidar_log = "lidar=None"
                 lidar_hud = "lidar=None"
 
-            if bboxes and d_value is not None:
-                print(
-                    f"[FRAME {frame_id}] zone={zone_text:>13} | "
-                    f"d={d_value:7.2f}px | motion={motion_score:.4f} | boxes={len(bboxes)} | {lidar_log} | fusion={fusion.level}"
-                )
-            else:
-                print(
-                    f"[FRAME {frame_id}] zone=NO_TARGET   | "
-                    f"d=   n/a  | motion={motion_score:.4f} | boxes=0 | {lidar_log} | fusion={fusion.level}"
-                )
+            d_log = f"{d_value:7.2f}px" if d_value is not None else "   n/a  "
+            log_lines.append(
+                f"[FRAME {frame_id}] zone={zone_text:>13} | "
+                f"d={d_log} | motion={motion_score:.4f} | boxes={len(boxes)} | {lidar_log} | fusion={level}"
+            )
+            if len(log_lines) >= LOG_BATCH_FRAMES:
+                sys.stdout.write("\n".join(log_lines) + "\n")
+                log_lines.clear()
 
             # --- 3) HUD 叠加 ---
-            hud = (
-                f"LEVEL: {fusion.level} | "
-                f"zone={fusion.vision.zone.name if fusion.vision and fusion.vision.zone else zone_text} | "
-                f"d={fusion.vision.geom_distance_px:.1f}px | "
-                f"{lidar_hud}"
-            )
+            # SafetyZone 是 IntEnum，OUTSIDE_SAFE == 0 为假值，必须用 is not None 判断
+            vision = fusion.vision
+            hud_zone = vision.zone.name if vision is not None and vision.zone is not None else zone_text
+            hud = f"LEVEL: {level} | zone={hud_zone} | d={vision.geom_distance_px:.1f}px | {lidar_hud}"
 
-            cv2.putText(
+            # HUD 文字不变时直接贴缓存好的字形（见 core.text_cache）
+            put_text_cached(
                 vis,
                 hud,
                 (20, 40),
-                cv2.FONT_HERSHEY_SIMPLEX,
                 1.0,
                 hud_color,
                 2,
@@ -361,6 +313,9 @@ def main() -> None:
                 break
 
     finally:
+        lidar_poller.stop()
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
         camera.release()
         cv2.destroyAllWindows()
 
@@ -10,11 +10,11 @@ Fusion live UI demo:
 from __future__ import annotations
 
 import sys
-import time
 from pathlib import Path
 from typing import List, Tuple
 
 import cv2
+import numpy as np
 
 DOWNSCALE_FACTOR = 0.4  # e.g. 1920x1080 -> 768x432
 # Adjust sys.path to include project root for imports
@@ -26,30 +26,32 @@ if str(project_root) not in sys.path:
 from core import config  # noqa: E402
 from core.camera_driver import CameraDriver  # noqa: E402
 from core.image_comparator import ImageComparator  # noqa: E402
+from core.line_overlay import build_static_overlay  # noqa: E402
+from core.text_cache import put_text_cached  # noqa: E402
 from core.distance_compare_geometry import (  # noqa: E402
     build_line_points_from_config,
     foot_from_bbox,
-    signed_distance_to_line,
+    line_coefficients,
     classify_distance_zone,
 )
-from core.lidar_bridge import read_lidar_once  # noqa: E402
+from core.lidar_bridge import LidarPoller, LidarSnapshot  # noqa: E402
 from core.vision_lidar_fusion import fuse_vision_and_lidar, FusionLevel  # noqa: E402
 from core.vision_safety_logic import (  # noqa: E402
     VisionSafetyResult,
     SafetyLevel,
     SafetyZone,
+    bboxes_to_array,
 )
 
-_last_lidar_snapshot = None
-_last_lidar_time = 0.0
+LIDAR_INTERVAL_SEC = 0.2  # 雷达在后台线程每 0.2 秒采一次，不阻塞取帧
 
 
-def pick_main_bbox(bboxes: List[Tuple[int, int, int, int]]) -> Tuple[int, int, int, int] | None:
-    """从多个 bbox 中挑一个“主目标”：y+h 最大（画面最低的那个）。"""
+def pick_main_bbox(boxes: np.ndarray) -> int | None:
+    """从 (N, 4) 的 x, y, w, h 数组中挑一个“主目标”的行号：y+h 最大（画面最低的那个）。"""
 
-    if not bboxes:
+    if len(boxes) == 0:
         return None
-    return max(bboxes, key=lambda b: b[1] + b[3])
+    return int(np.argmax(boxes[:, 1] + boxes[:, 3]))
 
 
 def main() -> None:
@@ -68,99 +70,80 @@ def main() -> None:
         print("[ERROR] Failed to open camera.")
         return
 
-    comparator = ImageComparator()
-
     frame = camera.get_frame()
     if frame is None:
         print("[ERROR] Cannot read first frame.")
         camera.release()
         return
 
-    def parse_compare(res):
-        local_bboxes: List[Tuple[int, int, int, int]] = []
-        local_motion: float = 0.0
-        if isinstance(res, (tuple, list)):
-            if len(res) == 3:
-                local_bboxes, local_motion, _ = res
-            elif len(res) == 2:
-                local_bboxes, local_motion = res
-            elif len(res) == 1:
-                local_bboxes = res[0]
-        elif isinstance(res, dict):
-            local_bboxes = res.get("bboxes", []) or []
-            motion_raw = res.get("motion_score", 0.0)
-            try:
-                local_motion = float(motion_raw)
-            except (TypeError, ValueError):
-                local_motion = 0.0
-        elif res is None:
-            local_bboxes = []
-            local_motion = 0.0
-        else:
-            local_bboxes = res  # type: ignore[assignment]
-        return local_bboxes, local_motion
-
+    # 显示/处理尺寸在启动时定一次；每帧 resize 进同一个 frame_small 缓冲区
     h_full, w_full = frame.shape[:2]
-    w_small = int(w_full * DOWNSCALE_FACTOR)
-    h_small = int(h_full * DOWNSCALE_FACTOR)
-    frame_small = cv2.resize(frame, (w_small, h_small))
+    small_size = (int(w_full * DOWNSCALE_FACTOR), int(h_full * DOWNSCALE_FACTOR))
+    frame_small = cv2.resize(frame, small_size)
+
+    # 显示用 INTER_LINEAR（比 INTER_AREA 快得多）；运动检测在显示尺寸的一半上做，
+    # 整 2 倍缩小用 INTER_NEAREST 即可（差分前还会高斯模糊）
+    comparator = ImageComparator(proc_width=small_size[0] // 2, proc_interp=cv2.INTER_NEAREST)
 
     h, w = frame_small.shape[:2]
     p1, p2 = build_line_points_from_config(w, h, dist_cfg)
+    # 黄线固定：归一化系数只算一次，d = a*x + b*y + c（同 signed_distance_to_line）
+    line_a, line_b, line_c = line_coefficients(p1, p2)
+    static_overlay, static_mask, static_roi = build_static_overlay(w, h, p1, p2)
     print(f"[INFO] frame size (small) = {w}x{h}")
+    frame_label_org = (20, h - 20)  # 帧号标签位置，尺寸固定后不再变化
     print(f"[INFO] yellow line p1={p1}, p2={p2}")
 
-    cv2.namedWindow("fusion_live_ui", cv2.WINDOW_NORMAL)
+    # OpenGL window: imshow uploads a texture and the GPU does the scaling
+    try:
+        cv2.namedWindow("fusion_live_ui", cv2.WINDOW_NORMAL | cv2.WINDOW_OPENGL)
+    except cv2.error:  # OpenCV built without OpenGL support
+        cv2.namedWindow("fusion_live_ui", cv2.WINDOW_NORMAL)
 
     PRINT_INTERVAL = 10
-    VISION_INTERVAL =2 # 每 2帧跑一次运动检测
-    last_bboxes: List[Tuple[int, int, int, int]] = []
-    last_motion_score: float = 0.0
+    VISION_INTERVAL = 2  # 每 2 帧处理一帧；其余帧只 grab()，不解码
     frame_id = 0
+    # HUD 文本只在内容变化时重新拼接；栅格化结果由 put_text_cached 缓存
+    last_hud_key = None
+    hud = ""
+    lidar_poller = LidarPoller(LIDAR_INTERVAL_SEC)
+    lidar_poller.start()
     try:
         while True:
-            frame = camera.get_frame()
-            if frame is None:
-                print("[WARN] Failed to read frame, break.")
+            if not camera.grab():
+                print("[WARN] Failed to grab frame, break.")
                 break
 
             frame_id += 1
-            h_full, w_full = frame.shape[:2]
-            w_small = int(w_full * DOWNSCALE_FACTOR)
-            h_small = int(h_full * DOWNSCALE_FACTOR)
-            frame_small = cv2.resize(frame, (w_small, h_small))
+            if frame_id % VISION_INTERVAL != 0:
+                continue
 
-            work = frame_small
-            h, w = work.shape[:2]
-            vis = work.copy()
+            frame = camera.retrieve()
+            if frame is None:
+                print("[WARN] Failed to read frame, break.")
+                break
 
-            if frame_id % VISION_INTERVAL == 0:
-                result = comparator.compare(work)
-                last_bboxes, last_motion_score = parse_compare(result)
+            # fixed dsize, so the buffer is reused even if the stream resolution changes
+            cv2.resize(frame, small_size, dst=frame_small)
 
-            bboxes = last_bboxes
-            motion_score = last_motion_score
+            work = frame_small
+            # work is rewritten by the resize every frame and compare() only
+            # reads it (before any drawing), so draw straight onto it
+            vis = work
+
+            # compare() always returns a dict with a list of bboxes and a float score
+            result = comparator.compare(work)
+            bboxes: List[Tuple[int, int, int, int]] = result["bboxes"]
+            motion_score: float = result["motion_score"]
             has_person = len(bboxes) > 0
 
             # --- Geometry: yellow line & foot distance ---
-            cv2.line(
-                vis,
-                (int(p1[0]), int(p1[1])),
-                (int(p2[0]), int(p2[1])),
-                (0, 255, 255),
-                3,
-            )
-            cv2.putText(
-                vis,
-                "YELLOW LINE",
-                (int(p1[0]) + 10, int(p1[1]) - 10),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.8,
-                (0, 255, 255),
-                2,
-            )
+            # 黄线 + 标签：启动时栅格化一次，每帧贴上
+            cv2.copyTo(static_overlay, static_mask, vis[static_roi])
 
-            main_bbox = pick_main_bbox(bboxes)
+            boxes = bboxes_to_array(bboxes)
+            main_i = pick_main_bbox(boxes)
+            main_bbox = tuple(boxes[main_i].tolist()) if main_i is not None else None
             d_px: float | None = None
             zone_text = "NO_TARGET"
             vision_result = VisionSafetyResult(
@@ -174,7 +157,7 @@ def main() -> None:
             if main_bbox:
                 x, y, bw, bh = main_bbox
                 fx, fy = foot_from_bbox(main_bbox)
-                d_px = signed_distance_to_line((fx, fy), p1, p2)
+                d_px = line_a * fx + line_b * fy + line_c
                 zone_text = classify_distance_zone(d_px, dist_cfg)
 
                 if zone_text in ("OUTSIDE_SAFE", "NEAR_LINE"):
@@ -198,14 +181,8 @@ def main() -> None:
                 cv2.rectangle(vis, (x, y), (x + bw, y + bh), (0, 255, 0), 2)
                 cv2.circle(vis, (int(fx), int(fy)), 6, (0, 0, 255), -1)
 
-            # --- LiDAR sampling with simple cache ---
-            now = time.time()
-            global _last_lidar_snapshot, _last_lidar_time
-            if now - _last_lidar_time >= 0.2 or _last_lidar_snapshot is None:
-                _last_lidar_snapshot = read_lidar_once()
-                _last_lidar_time = now
-
-            lidar_snapshot = _last_lidar_snapshot
+            # --- LiDAR: newest snapshot from the background poller ---
+            lidar_snapshot: LidarSnapshot | None = lidar_poller.latest
             lidar_cm = (
                 lidar_snapshot.distance_cm
                 if (lidar_snapshot and lidar_snapshot.ok and lidar_snapshot.distance_cm is not None)
@@ -229,29 +206,26 @@ def main() -> None:
             cab_idx = "-"
             authorized = "-"
 
-            d_text = f"{d_px:.2f}px" if d_px is not None else "n/a"
-            hud = (
-                f"FUSION: {fusion.level} | "
-                f"VISION_ZONE={zone_text} | "
-                f"d={d_text} | "
-                f"LIDAR={lidar_text} | CAB={cab_idx} | AUTH={authorized}"
-            )
+            # d 显示到 0.1px，静止场景下 HUD 文本逐帧不变，直接命中缓存
+            d_key = round(d_px, 1) if d_px is not None else None
+            hud_key = (fusion.level, zone_text, d_key, lidar_text)
+            if hud_key != last_hud_key:
+                last_hud_key = hud_key
+                d_text = f"{d_key:.1f}px" if d_key is not None else "n/a"
+                hud = (
+                    f"FUSION: {fusion.level} | "
+                    f"VISION_ZONE={zone_text} | "
+                    f"d={d_text} | "
+                    f"LIDAR={lidar_text} | CAB={cab_idx} | AUTH={authorized}"
+                )
 
-            cv2.putText(
-                vis,
-                hud,
-                (20, 40),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.9,
-                hud_color,
-                2,
-            )
+            put_text_cached(vis, hud, (20, 40), 0.9, hud_color, 2)
 
             # 在左下角标出当前帧号，便于确认画面是否在更新
             cv2.putText(
                 vis,
                 f"frame={frame_id}",
-                (20, h - 20),
+                frame_label_org,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.7,
                 (0, 255, 0),
@@ -275,6 +249,7 @@ def main() -> None:
                 break
 
     finally:
+        lidar_poller.stop()
         camera.release()
         cv2.destroyAllWindows()
 
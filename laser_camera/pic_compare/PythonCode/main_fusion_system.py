@@ -25,11 +25,17 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
+from core.camera_driver import open_rtsp_camera, open_usb_camera
+from core.rtsp_reader import RtspReader
+from core.text_cache import put_text_cached
+
+# core.lidar_bridge 在导入时加载真实串口驱动 (lidar_distance 的 new_lidar / pyserial)，
+# 驱动缺失或初始化出错时它会原样抛出（不一定是 ImportError），因此这里按 Exception 捕获
 try:
-    from lidar_distance.PythonCode.core.new_lidar import get_lidar_distance_cm
+    from core.lidar_bridge import LidarPoller
     LIDAR_AVAILABLE = True
-except ImportError:
-    print("[系统] 警告：未找到激光雷达驱动，将使用模拟数据。")
+except Exception as e:
+    print(f"[系统] 警告：激光雷达驱动不可用（{e}），将使用模拟数据。")
     LIDAR_AVAILABLE = False
 
 try:
@@ -52,18 +58,28 @@ RTSP_URL = "rtsp://192.168.1.64:554/stream1"
 # 模拟的黄线区域 (x, y, w, h)，实际应通过算法计算
 YELLOW_LINE_BOX = (200, 300, 400, 200) 
 
+# HUD 颜色常量 (BGR)
+HUD_BAR_H = 40
+COLOR_ZONE = (255, 255, 0)
+COLOR_PERSON = (0, 0, 255)
+COLOR_TEXT = (0, 0, 0)
+# warning_level -> 顶栏颜色，未知等级按 SAFE (绿色) 处理
+_STATUS_COLORS = {
+    "DANGER": (0, 0, 255),   # Red
+    "CAUTION": (0, 255, 255),  # Yellow
+}
+_STATUS_DEFAULT = (0, 255, 0)  # Green
+
+# FPS 按窗口统计：每 FPS_WINDOW 帧读一次时钟并更新 HUD 上的数值
+FPS_WINDOW = 30
+
 def draw_hud(frame, fusion_state, fps):
     """在画面上绘制 HUD 信息"""
     h, w = frame.shape[:2]
     
     # 1. 绘制状态顶栏
-    status_color = (0, 255, 0) # Green
-    if fusion_state.warning_level == "DANGER":
-        status_color = (0, 0, 255) # Red
-    elif fusion_state.warning_level == "CAUTION":
-        status_color = (0, 255, 255) # Yellow
-        
-    cv2.rectangle(frame, (0, 0), (w, 40), status_color, -1)
+    status_color = _STATUS_COLORS.get(fusion_state.warning_level, _STATUS_DEFAULT)
+    cv2.rectangle(frame, (0, 0), (w, HUD_BAR_H), status_color, -1)
     
     # 2. 显示文字信息
     dist_str = f"{fusion_state.distance_cm:.1f}cm" if fusion_state.distance_cm else "N/A"
@@ -72,20 +88,21 @@ def draw_hud(frame, fusion_state, fps):
         f"DIST: {dist_str} | "
         f"FPS: {fps:.1f}"
     )
-    cv2.putText(frame, info_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+    # 距离随雷达约 0.2s 更新一次、FPS 每 FPS_WINDOW 帧更新一次，其余帧命中文字缓存
+    put_text_cached(frame, info_text, (10, 30), 0.8, COLOR_TEXT, 2)
 
     # 3. 绘制模拟的黄线/机位区域 (蓝色框)
     # 这里只是演示，未来替换为 vision_logic 计算出的区域
     bx, by, bw, bh = YELLOW_LINE_BOX
-    cv2.rectangle(frame, (bx, by), (bx+bw, by+bh), (255, 255, 0), 2)
-    cv2.putText(frame, "Safety Zone", (bx, by-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+    cv2.rectangle(frame, (bx, by), (bx+bw, by+bh), COLOR_ZONE, 2)
+    put_text_cached(frame, "Safety Zone", (bx, by-10), 0.5, COLOR_ZONE, 1)
 
     # 4. 如果有人（这里用 vision_state 模拟），画一个红框示意
     # 实际项目中，这里应该用 YOLO 或 运动检测的 bbox
     if fusion_state.vision.person_present:
         # 模拟一个人的框
-        cv2.rectangle(frame, (300, 200), (500, 500), (0, 0, 255), 2)
-        cv2.putText(frame, "Person Detected", (300, 190), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+        cv2.rectangle(frame, (300, 200), (500, 500), COLOR_PERSON, 2)
+        put_text_cached(frame, "Person Detected", (300, 190), 0.6, COLOR_PERSON, 2)
 
     return frame
 
@@ -94,12 +111,12 @@ def main():
     print("[系统] 请确保电脑 IP 已设置为同网段 (例如 192.168.1.200)")
     
     # 打开 RTSP 流
-    cap = cv2.VideoCapture(RTSP_URL)
+    cap = open_rtsp_camera(RTSP_URL)
     
     # 如果连接失败，尝试本地摄像头作为 fallback，或者直接报错
     if not cap.isOpened():
         print("[错误] 无法打开 RTSP 流。正在尝试本地摄像头 (index 0)...")
-        cap = cv2.VideoCapture(0)
+        cap = open_usb_camera(0)
         if not cap.isOpened():
             print("[错误] 无法打开任何摄像头。退出。")
             return
@@ -115,27 +132,41 @@ def main():
         gesture=GestureCode.NONE
     )
 
-    prev_time = time.time()
-    
+    fps = 0.0
+    fps_n = 0
+    fps_t0 = time.monotonic_ns()
+
+    # 后台线程解码 RTSP，主循环只取最新一帧
+    reader = RtspReader(cap)
+    reader.start()
+    lidar_poller = LidarPoller() if LIDAR_AVAILABLE else None
+    if lidar_poller is not None:
+        lidar_poller.start()
+    lidar_warned = False
+
     try:
         while True:
             # 1. 读取图像帧
-            ret, frame = cap.read()
-            if not ret:
+            frame = reader.latest(timeout=1.0)
+            if frame is None:
                 print("[警告] 无法读取视频帧，正在重试...")
-                time.sleep(0.1)
                 continue
 
             # 缩放一下，避免 200万像素太大占满屏幕
             frame = cv2.resize(frame, (1024, 576))
 
             # 2. 获取激光雷达数据
+            # 后台线程轮询雷达，这里只取最新快照，读取失败时为 None
+            # 驱动已加载但读取失败（串口未接、超时等）时同样退回模拟数据 (dist=None)
             dist = None
-            if LIDAR_AVAILABLE:
-                try:
-                    dist = get_lidar_distance_cm()
-                except Exception as e:
-                    pass # 忽略雷达读取错误，保持画面流畅
+            snap = lidar_poller.latest if lidar_poller is not None else None
+            if snap is not None:
+                if snap.ok:
+                    dist = snap.distance_cm
+                    lidar_warned = False
+                elif not lidar_warned:
+                    print(f"[系统] 警告：激光雷达读取失败（{snap.error}），暂用模拟数据。")
+                    lidar_warned = True
 
             # 3. 融合逻辑 (使用 core.fusion_logic)
             # 注意：这里目前传入的是 dummy_vision，未来要接入真实的 vision 算法输出
@@ -143,9 +174,12 @@ def main():
             fusion_result = fuse_sensors(dist, current_vision)
 
             # 4. 计算 FPS
-            curr_time = time.time()
-            fps = 1 / (curr_time - prev_time) if curr_time > prev_time else 0
-            prev_time = curr_time
+            fps_n += 1
+            if fps_n == FPS_WINDOW:
+                now_ns = time.monotonic_ns()
+                fps = fps_n * 1e9 / max(now_ns - fps_t0, 1)
+                fps_t0 = now_ns
+                fps_n = 0
 
             # 5. 绘制 UI 并显示
             display_frame = draw_hud(frame, fusion_result, fps)
@@ -158,6 +192,9 @@ def main():
     except KeyboardInterrupt:
         print("\n[系统] 用户停止。")
     finally:
+        if lidar_poller is not None:
+            lidar_poller.stop()
+        reader.stop()
         cap.release()
         cv2.destroyAllWindows()
 
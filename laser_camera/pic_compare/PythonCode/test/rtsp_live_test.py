@@ -12,6 +12,10 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from core import config
+from core.camera_driver import open_rtsp_camera, open_usb_camera
+
+# every frame is read and counted, every DISPLAY_STRIDE-th one is shown / polled for keys
+DISPLAY_STRIDE = 2
 
 
 def main() -> None:
@@ -23,11 +27,17 @@ def main() -> None:
         source = cam_cfg.device_index
         print(f"[TEST] Using USB index: {source}")
 
-    cap = cv2.VideoCapture(source)
+    cap = open_rtsp_camera(source) if cam_cfg.use_rtsp else open_usb_camera(source)
     if not cap.isOpened():
         print("[TEST] Failed to open source:", source)
         raise SystemExit(1)
 
+    # OpenGL window: imshow uploads a texture and the GPU does the scaling
+    try:
+        cv2.namedWindow("rtsp_live_test", cv2.WINDOW_NORMAL | cv2.WINDOW_OPENGL)
+    except cv2.error:  # OpenCV built without OpenGL support
+        cv2.namedWindow("rtsp_live_test", cv2.WINDOW_NORMAL)
+
     frame_id = 0
     last_print = time.time()
 
@@ -38,7 +48,6 @@ def main() -> None:
             break
 
         frame_id += 1
-        cv2.imshow("rtsp_live_test", frame)
 
         now = time.time()
         if now - last_print >= 1.0:
@@ -47,6 +56,9 @@ def main() -> None:
             frame_id = 0
             last_print = now
 
+        if frame_id % DISPLAY_STRIDE:
+            continue
+        cv2.imshow("rtsp_live_test", frame)
         key = cv2.waitKey(1) & 0xFF
         if key == ord("q"):
             break
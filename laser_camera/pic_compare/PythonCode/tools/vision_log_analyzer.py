@@ -43,69 +43,104 @@ class LogStats:
     safe_field: str
 
 
-def _detect_field_name(row: dict, candidates: list[str]) -> Optional[str]:
+# Column name candidates, tolerant to slightly different CSV headers (first match wins)
+_ZONE_FIELDS = ("line_zone", "zone")
+_STATE_FIELDS = ("line_state", "state")
+_SAFE_FIELDS = ("safe", "is_safe")
+
+
+def _detect_field_name(header: list[str], candidates: tuple[str, ...]) -> Optional[str]:
     """
     Pick the first existing field from candidates.
     Returns None if none of them exists.
     """
     for name in candidates:
-        if name in row:
+        if name in header:
             return name
     return None
 
 
-def load_log(path: Path = DEFAULT_LOG) -> list[dict]:
-    if not path.exists():
-        print(f"[ERROR] vision log not found: {path}")
-        return []
-
-    with path.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    if not rows:
-        print(f"[WARN] vision log is empty: {path}")
-        return []
-
-    return rows
-
+# safe column value -> normalised 'True' / 'False' (other values are kept as-is);
+# the exact spellings the demos write hit without a .lower()
+_SAFE_NORM = {
+    "True": "True", "False": "False",
+    "1": "True", "true": "True", "yes": "True",
+    "0": "False", "false": "False", "no": "False",
+}
 
-def compute_stats(rows: list[dict]) -> LogStats:
-    # Try to be tolerant to slightly different column names
-    sample = rows[0]
 
-    line_zone_field = _detect_field_name(sample, ["line_zone", "zone"])
-    line_state_field = _detect_field_name(sample, ["line_state", "state"])
-    safe_field = _detect_field_name(sample, ["safe", "is_safe"])
+def _is_danger_zone(zone: str) -> bool:
+    # You can adjust the definition of "danger zone" here if needed
+    zone = zone.upper()
+    return zone.startswith("INSIDE") or zone == "DANGER"
 
-    if line_zone_field is None or line_state_field is None or safe_field is None:
-        raise RuntimeError(
-            f"Could not detect expected fields in CSV header. "
-            f"Got columns: {list(sample.keys())}"
-        )
 
-    zone_counts: Counter = Counter()
-    state_counts: Counter = Counter()
-    safe_counts: Counter = Counter()
-
-    for row in rows:
-        zone = row.get(line_zone_field, "").strip()
-        state = row.get(line_state_field, "").strip()
-        safe_raw = row.get(safe_field, "").strip()
-
-        # Normalise safe value to 'True' / 'False'
-        safe_norm = safe_raw
-        if safe_raw.lower() in ("1", "true", "yes"):
-            safe_norm = "True"
-        elif safe_raw.lower() in ("0", "false", "no"):
-            safe_norm = "False"
+def analyze_stream(path: Path = DEFAULT_LOG) -> Optional[tuple[LogStats, int]]:
+    """
+    One streaming pass over the CSV: counts per zone / state / safe flag and
+    a rough number of crossings into the danger zone (changes of line_zone).
 
-        zone_counts[zone] += 1
-        state_counts[state] += 1
-        safe_counts[safe_norm] += 1
+    Rows are read with csv.reader and never kept, so memory does not grow
+    with the log. Returns (stats, crossings), or None if the log is missing
+    or has no data rows.
+    """
+    if not path.exists():
+        print(f"[ERROR] vision log not found: {path}")
+        return None
+
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+
+        line_zone_field = _detect_field_name(header, _ZONE_FIELDS)
+        line_state_field = _detect_field_name(header, _STATE_FIELDS)
+        safe_field = _detect_field_name(header, _SAFE_FIELDS)
+        fields_ok = None not in (line_zone_field, line_state_field, safe_field)
+        if fields_ok:
+            zone_i = header.index(line_zone_field)
+            state_i = header.index(line_state_field)
+            safe_i = header.index(safe_field)
+
+        zone_counts: Counter = Counter()
+        state_counts: Counter = Counter()
+        safe_counts: Counter = Counter()
+        danger_by_zone: dict[str, bool] = {}  # zone text -> in danger, decided once
+        total = 0
+        crossings = 0
+        prev_in_danger: Optional[bool] = None  # None before the first row
+
+        for row in reader:
+            if not row:  # blank line (DictReader skipped these too)
+                continue
+            if not fields_ok:
+                raise RuntimeError(
+                    f"Could not detect expected fields in CSV header. "
+                    f"Got columns: {header}"
+                )
+            total += 1
+
+            n = len(row)
+            zone = row[zone_i].strip() if zone_i < n else ""
+            state = row[state_i].strip() if state_i < n else ""
+            safe_raw = row[safe_i].strip() if safe_i < n else ""
+
+            zone_counts[zone] += 1
+            state_counts[state] += 1
+            safe_counts[_SAFE_NORM.get(safe_raw) or _SAFE_NORM.get(safe_raw.lower(), safe_raw)] += 1
+
+            in_danger = danger_by_zone.get(zone)
+            if in_danger is None:
+                in_danger = danger_by_zone[zone] = _is_danger_zone(zone)
+            if in_danger and prev_in_danger is False:
+                crossings += 1
+            prev_in_danger = in_danger
+
+    if total == 0:
+        print(f"[WARN] vision log is empty: {path}")
+        return None
 
-    return LogStats(
-        total_frames=len(rows),
+    stats = LogStats(
+        total_frames=total,
         zone_counts=zone_counts,
         state_counts=state_counts,
         safe_counts=safe_counts,
@@ -113,34 +148,10 @@ def compute_stats(rows: list[dict]) -> LogStats:
         line_state_field=line_state_field,
         safe_field=safe_field,
     )
+    return stats, crossings
 
 
-def estimate_crossings(rows: list[dict], zone_field: str) -> int:
-    """
-    Roughly estimate how many times the operator crossed into the danger zone,
-    based on changes of line_zone.
-    """
-    prev_zone: Optional[str] = None
-    crossings = 0
-
-    for row in rows:
-        zone = row.get(zone_field, "").strip()
-        # You can adjust the definition of "danger zone" here if needed
-        in_danger = zone.upper().startswith("INSIDE") or zone.upper() == "DANGER"
-        prev_in_danger = (
-            prev_zone is not None
-            and (prev_zone.upper().startswith("INSIDE") or prev_zone.upper() == "DANGER")
-        )
-
-        if in_danger and not prev_in_danger and prev_zone is not None:
-            crossings += 1
-
-        prev_zone = zone
-
-    return crossings
-
-
-def print_report(path: Path, stats: LogStats, rows: list[dict]) -> None:
+def print_report(path: Path, stats: LogStats, crossings: int) -> None:
     print("=== Vision line log analysis ===")
     print(f"Log file      : {path}")
     print(f"Total frames  : {stats.total_frames}")
@@ -158,7 +169,6 @@ def print_report(path: Path, stats: LogStats, rows: list[dict]) -> None:
     _print_counter("By line_state:", stats.state_counts)
     _print_counter("By safe flag:", stats.safe_counts)
 
-    crossings = estimate_crossings(rows, stats.line_zone_field)
     print(f"Estimated danger crossings: {crossings}")
     print()
     print("Tip: if some fields look wrong, check the CSV header and, if needed,")
@@ -168,12 +178,12 @@ def print_report(path: Path, stats: LogStats, rows: list[dict]) -> None:
 
 def main() -> None:
     log_path = DEFAULT_LOG
-    rows = load_log(log_path)
-    if not rows:
+    result = analyze_stream(log_path)
+    if result is None:
         return
 
-    stats = compute_stats(rows)
-    print_report(log_path, stats, rows)
+    stats, crossings = result
+    print_report(log_path, stats, crossings)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 import sys
 
@@ -12,31 +13,54 @@ if str(project_root) not in sys.path:
 from core.image_comparator import ImageComparator
 from core.vision_safety_logic import VisionSafetyLogic, SafetyLevel
 from core.output_policy import OutputPolicy
+from core.camera_driver import open_usb_camera
+from core.rtsp_reader import RtspReader
 import cv2
 from typing import Tuple
 
 
+# drawing constants
+COLOR_BOX = (0, 255, 0)
+COLOR_TARGET = (0, 255, 255)
+COLOR_TEXT = (0, 0, 0)
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+BAR_H = 40
+
+# every frame is evaluated, every DISPLAY_STRIDE-th one is drawn / shown / polled for keys
+DISPLAY_STRIDE = 2
+# shown frames wider than this are downscaled (aspect kept) before imshow
+DISPLAY_MAX_W = 640
+
+# per-frame log lines are collected and written to stdout LOG_BATCH_FRAMES at a time
+LOG_BATCH_FRAMES = 30
+# level -> (status text, bar color)
+_LEVEL_STYLE = {
+    SafetyLevel.SAFE: ("SAFE", (0, 255, 0)),
+    SafetyLevel.CAUTION: ("CAUTION", (0, 255, 255)),
+    SafetyLevel.DANGER: ("DANGER", (0, 0, 255)),
+}
+
+
 def draw_status(
     image,
     text: str,
     color: Tuple[int, int, int],
 ) -> None:
     """Draw a filled bar with status text at the top-left."""
-    bar_height = 40
-    cv2.rectangle(image, (0, 0), (image.shape[1], bar_height), color, thickness=-1)
-    cv2.putText(
-        image,
-        text,
-        (10, 28),
-        cv2.FONT_HERSHEY_SIMPLEX,
-        0.8,
-        (0, 0, 0),
-        2,
-    )
+    cv2.rectangle(image, (0, 0), (image.shape[1], BAR_H), color, thickness=-1)
+    cv2.putText(image, text, (10, 28), FONT, 0.8, COLOR_TEXT, 2)
 
 
 def main() -> None:
-    cap = cv2.VideoCapture(0)
+    parser = argparse.ArgumentParser(description="Vision safety UI (USB camera 0).")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="no window: evaluate, log and drive outputs only (Ctrl+C to quit)",
+    )
+    args = parser.parse_args()
+
+    cap = open_usb_camera(0)
     if not cap.isOpened():
         print("Error: cannot open camera 0.")
         return
@@ -45,12 +69,21 @@ def main() -> None:
     safety_logic = VisionSafetyLogic(line_band_top_ratio=0.6, line_band_bottom_ratio=0.8)
     output_policy = OutputPolicy()
 
-    print("Starting Vision Safety UI. Press 'q' to quit.")
+    if args.headless:
+        print("Starting Vision Safety UI (headless). Press Ctrl+C to quit.")
+    else:
+        print("Starting Vision Safety UI. Press 'q' to quit.")
+
+    # capture + decode overlap with compare/draw; the loop always gets the newest frame
+    reader = RtspReader(cap)
+    reader.start()
 
+    log_lines: list[str] = []
+    frame_idx = 0
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret or frame is None:
+            frame = reader.latest(timeout=1.0)
+            if frame is None:
                 print("Error: failed to read frame from camera.")
                 break
 
@@ -58,46 +91,55 @@ def main() -> None:
             bboxes = compare_result.get("bboxes", [])
             motion_score = float(compare_result.get("motion_score", 0.0))
             safety = safety_logic.evaluate(frame.shape, bboxes)
+            status_text, color = _LEVEL_STYLE[safety.level]
+
+            log_lines.append(
+                f"[VISION_UI] level={status_text} zone={safety.zone.name} "
+                f"score={motion_score:.4f} num_boxes={len(bboxes)}"
+            )
+            if len(log_lines) >= LOG_BATCH_FRAMES:
+                sys.stdout.write("\n".join(log_lines) + "\n")
+                log_lines.clear()
+            output_policy.apply(safety.level)
 
-            display = frame.copy()
+            frame_idx += 1
+            if args.headless or frame_idx % DISPLAY_STRIDE:
+                continue
+
+            # compare() keeps its own grayscale copy, so draw straight onto the frame
+            display = frame
 
             # Draw all bounding boxes
             for (x, y, w, h) in bboxes:
-                cv2.rectangle(display, (x, y), (x + w, y + h), (0, 255, 0), 2)
+                cv2.rectangle(display, (x, y), (x + w, y + h), COLOR_BOX, 2)
 
             # Highlight chosen bbox if present
             if safety.bbox is not None:
                 x, y, w, h = safety.bbox
-                cv2.rectangle(display, (x, y), (x + w, y + h), (0, 255, 255), 3)
-
-            # Status text and color
-            if safety.level == SafetyLevel.SAFE:
-                status_text = "SAFE"
-                color = (0, 255, 0)
-            elif safety.level == SafetyLevel.CAUTION:
-                status_text = "CAUTION"
-                color = (0, 255, 255)
-            else:
-                status_text = "DANGER"
-                color = (0, 0, 255)
+                cv2.rectangle(display, (x, y), (x + w, y + h), COLOR_TARGET, 3)
+
+            # downscale before the status bar so the text stays readable at window size
+            fh, fw = display.shape[:2]
+            if fw > DISPLAY_MAX_W:
+                display = cv2.resize(display, (DISPLAY_MAX_W, fh * DISPLAY_MAX_W // fw))
 
             status_line = f"level={status_text} zone={safety.zone.name} score={motion_score:.3f} num_boxes={len(bboxes)}"
             draw_status(display, status_line, color)
 
             cv2.imshow("Vision Safety UI", display)
 
-            print(
-                f"[VISION_UI] level={status_text} zone={safety.zone.name} "
-                f"score={motion_score:.4f} num_boxes={len(bboxes)}"
-            )
-            output_policy.apply(safety.level)
-
             key = cv2.waitKey(1) & 0xFF
             if key == ord("q"):
                 break
+    except KeyboardInterrupt:
+        pass
     finally:
+        reader.stop()
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
         cap.release()
-        cv2.destroyAllWindows()
+        if not args.headless:
+            cv2.destroyAllWindows()
 
 
 if __name__ == "__main__":
@@ -9,9 +9,11 @@ adapters/base/__init__.py
 
 from .camera_base import (
     CameraDetection,
+    CameraDetectionBatch,
     CameraStatus,
     CameraAdapter,
     validate_detection,
+    validate_detections_batch,
     compute_footpoint_from_bbox
 )
 
@@ -38,9 +40,11 @@ from .lamp_base import (
 __all__ = [
     # 相机适配器
     'CameraDetection',
+    'CameraDetectionBatch',
     'CameraStatus',
     'CameraAdapter',
     'validate_detection',
+    'validate_detections_batch',
     'compute_footpoint_from_bbox',
     
     # 测距适配器
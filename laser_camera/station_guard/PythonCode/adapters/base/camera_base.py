@@ -17,8 +17,10 @@ from dataclasses import dataclass
 from typing import Optional, List
 from enum import Enum
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CameraDetection:
     """
     单个人员检测结果的标准化表示
@@ -26,6 +28,9 @@ class CameraDetection:
     这是相机适配器与系统核心之间的数据契约。
     无论底层使用 YOLO、SSD、还是其他检测算法，都必须转换为此格式。
     
+    slots + frozen：每帧会产生大量检测对象，去掉实例 __dict__。
+    x1 / y1 / x2 / y2 为 bbox 的只读属性。
+    
     Attributes:
         track_id: 跟踪ID（由检测器分配，用于多帧关联）
         bbox: 边界框 (x1, y1, x2, y2) 像素坐标
@@ -43,6 +48,26 @@ class CameraDetection:
     timestamp: float
     person_id: Optional[str] = None  # 可选：人脸识别或工牌识别的结果
     
+    @property
+    def x1(self) -> float:
+        """边界框左上角 u 坐标（像素）"""
+        return self.bbox[0]
+    
+    @property
+    def y1(self) -> float:
+        """边界框左上角 v 坐标（像素）"""
+        return self.bbox[1]
+    
+    @property
+    def x2(self) -> float:
+        """边界框右下角 u 坐标（像素）"""
+        return self.bbox[2]
+    
+    @property
+    def y2(self) -> float:
+        """边界框右下角 v 坐标（像素）"""
+        return self.bbox[3]
+    
     def bbox_width(self) -> float:
         """边界框宽度（像素）"""
         return self.bbox[2] - self.bbox[0]
@@ -53,16 +78,59 @@ class CameraDetection:
     
     def bbox_area(self) -> float:
         """边界框面积（像素²）"""
-        return self.bbox_width() * self.bbox_height()
+        x1, y1, x2, y2 = self.bbox
+        return (x2 - x1) * (y2 - y1)
     
     def bbox_center(self) -> tuple[float, float]:
         """边界框中心点 (u, v) 像素坐标"""
+        x1, y1, x2, y2 = self.bbox
         return (
-            (self.bbox[0] + self.bbox[2]) / 2,
-            (self.bbox[1] + self.bbox[3]) / 2
+            (x1 + x2) / 2,
+            (y1 + y2) / 2
         )
 
 
+@dataclass
+class CameraDetectionBatch:
+    """
+    一帧内所有检测结果的列式（SoA）表示
+    
+    供向量化的下游消费者使用：直接在 numpy 数组上计算，
+    不必逐个访问 CameraDetection 对象。
+    
+    Attributes:
+        x1, y1, x2, y2: 边界框坐标，shape (N,)
+        confidence: 检测置信度，shape (N,)
+        track_id: 跟踪ID，shape (N,)
+    """
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    confidence: np.ndarray
+    track_id: np.ndarray
+    
+    @classmethod
+    def from_detections(cls, detections: List[CameraDetection]) -> "CameraDetectionBatch":
+        """将检测结果列表打包为列式数组"""
+        n = len(detections)
+        coords = np.empty((4, n), dtype=np.float64)
+        confidence = np.empty(n, dtype=np.float64)
+        track_id = np.empty(n, dtype=np.int64)
+        for i, det in enumerate(detections):
+            coords[:, i] = det.bbox
+            confidence[i] = det.confidence
+            track_id[i] = det.track_id
+        return cls(coords[0], coords[1], coords[2], coords[3], confidence, track_id)
+    
+    def __len__(self) -> int:
+        return len(self.track_id)
+    
+    def bbox_areas(self) -> np.ndarray:
+        """所有边界框面积（像素²），shape (N,)"""
+        return (self.x2 - self.x1) * (self.y2 - self.y1)
+
+
 class CameraStatus(Enum):
     """相机运行状态"""
     READY = "ready"              # 就绪，正常运行
@@ -241,6 +309,39 @@ def validate_detection(detection: CameraDetection,
     return True, ""
 
 
+def validate_detections_batch(dets_array: np.ndarray,
+                              image_width: int,
+                              image_height: int) -> np.ndarray:
+    """
+    批量验证检测结果（validate_detection 的向量化版本）
+    
+    几何检查与 validate_detection 相同，但一次处理一帧内的全部检测；
+    置信度不在数组中，不做检查。
+    
+    Args:
+        dets_array: shape (N, 6)，列依次为 x1, y1, x2, y2, footpoint_u, footpoint_v
+        image_width: 图像宽度（像素）
+        image_height: 图像高度（像素）
+    
+    Returns:
+        shape (N,) 的 bool 数组，True 表示该检测有效
+    """
+    x1 = dets_array[:, 0]
+    y1 = dets_array[:, 1]
+    x2 = dets_array[:, 2]
+    y2 = dets_array[:, 3]
+    fu = dets_array[:, 4]
+    fv = dets_array[:, 5]
+    
+    valid = (x1 < x2) & (y1 < y2)
+    valid &= (x1 >= 0) & (x1 < image_width) & (x2 >= 0) & (x2 <= image_width)
+    valid &= (y1 >= 0) & (y1 < image_height) & (y2 >= 0) & (y2 <= image_height)
+    valid &= (fu >= 0) & (fu <= image_width) & (fv >= 0) & (fv <= image_height)
+    valid &= (fu >= x1 - 5) & (fu <= x2 + 5)
+    valid &= (fv >= y2 - 5) & (fv <= y2 + 5)
+    return valid
+
+
 def compute_footpoint_from_bbox(bbox: tuple[float, float, float, float]) -> tuple[float, float]:
     """
     从边界框计算脚点坐标（通用辅助函数）
@@ -279,6 +380,9 @@ if __name__ == "__main__":
     print(f"  Bbox size: {det.bbox_width():.0f} x {det.bbox_height():.0f} px")
     print(f"  Confidence: {det.confidence:.2f}")
     
+    batch = CameraDetectionBatch.from_detections([det, det])
+    print(f"  Batch: {len(batch)} detections, areas={batch.bbox_areas().tolist()}")
+    
     # 测试验证函数
     print("\n测试检测结果验证:")
     is_valid, msg = validate_detection(det, 1920, 1080)
@@ -286,6 +390,13 @@ if __name__ == "__main__":
     if not is_valid:
         print(f"  Error: {msg}")
     
+    dets = np.array([
+        [100, 200, 200, 400, 150, 400],   # 有效
+        [200, 200, 100, 400, 150, 400],   # x1 >= x2
+        [100, 200, 200, 400, 150, 300],   # 脚点不在底边
+    ], dtype=np.float64)
+    print(f"  Batch valid: {validate_detections_batch(dets, 1920, 1080).tolist()}")
+    
     # 测试脚点计算
     print("\n测试脚点计算:")
     bbox = (100, 200, 200, 400)